@@ -60,13 +60,12 @@ def get_run(run_id: int, db: Session = Depends(get_db)):
 
 @router.post("", response_model=RunOut, status_code=201)
 def create_run(payload: RunCreate, db: Session = Depends(get_db)):
-    from datetime import datetime, UTC
     import uuid
 
-    # Set defaults for optional fields
+    # Set defaults for optional fields; started_at falls back to the column default
     run_data = payload.model_dump(exclude_unset=True)
     if run_data.get("started_at") is None:
-        run_data["started_at"] = datetime.now(UTC)
+        run_data.pop("started_at", None)
     if run_data.get("correlation_id") is None:
         run_data["correlation_id"] = str(uuid.uuid4())
 
@@ -94,8 +94,6 @@ def preview_template(request: TemplatePreviewRequest, db: Session = Depends(get_
         HTTPException: If template_id is provided but template not found
         ValueError: If template format is invalid
     """
-    engine = TemplateEngine()
-
     # If template_id is provided, load from database
     if request.template_id:
         template = db.get(Template, request.template_id)
@@ -8,16 +8,209 @@ This module provides TypeScript code analysis capabilities including:
 - Type information extraction
 """
 
+import contextlib
+import hashlib
 import json
+import os
+import queue
 import re
 import subprocess
+import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from autodoc.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Matches the first line of a JSDoc tag: @tagName {type} [name] description or
+# @tagName description. Handles formats like:
+# - @param {string} name Description
+# - @param {string} [name] Optional description
+# - @returns {type} Description
+# - @deprecated Description
+# The tag name is captured generically, so one match per line recognizes every
+# tag kind (known or custom); _process_tag then routes it by name.
+_JSDOC_TAG_RE = re.compile(
+    r"@(\w+)(?:\s+(?:\{([^}]+)\})?(?:\s*\[?([^\]]+)\]?)?(?:\s+(.+))?)?",
+    re.MULTILINE,
+)
+
+# Tag content that starts with a {name} or [name] (optional parameter)
+_BRACED_NAME_RE = re.compile(r"\{([^}]+)\}\s*(.*)")
+_BRACKETED_NAME_RE = re.compile(r"\[([^\]]+)\]\s*(.*)")
+
+# Common symbol node kinds in TypeScript
+_SYMBOL_KINDS = frozenset(
+    {
+        "FunctionDeclaration",
+        "MethodDeclaration",
+        "ClassDeclaration",
+        "InterfaceDeclaration",
+        "TypeAliasDeclaration",
+        "VariableDeclaration",
+        "PropertyDeclaration",
+        "GetAccessor",
+        "SetAccessor",
+        "Constructor",
+        "EnumDeclaration",
+        "ModuleDeclaration",
+    }
+)
+
+# Name patterns tried in order against a symbol node's text, as
+# (node kind prefix, pattern); a pattern applies to every node kind that
+# starts with its prefix.
+# Function: function name(...)
+# Class: class Name
+# Interface: interface Name
+_SYMBOL_NAME_PATTERNS = tuple(
+    (kind.split("Declaration")[0], re.compile(pattern))
+    for kind, pattern in (
+        ("FunctionDeclaration", r"function\s+(\w+)"),
+        ("MethodDeclaration", r"(\w+)\s*\([^)]*\)"),
+        ("ClassDeclaration", r"class\s+(\w+)"),
+        ("InterfaceDeclaration", r"interface\s+(\w+)"),
+        ("TypeAliasDeclaration", r"type\s+(\w+)"),
+        ("VariableDeclaration", r"(?:const|let|var)\s+(\w+)"),
+        ("PropertyDeclaration", r"(\w+)\s*:"),
+        ("EnumDeclaration", r"enum\s+(\w+)"),
+    )
+)
+
+
+# Seconds to wait for the Node.js bridge to answer one parse request
+_PARSE_TIMEOUT = 30
+
+# Characters of node text kept for previews. Only symbol nodes need their full
+# text (for name extraction); every other node's text is only previewed.
+_TEXT_PREVIEW_LENGTH = 200
+
+# Long-lived Node.js bridge around the TypeScript compiler API. It reads one
+# JSON request per line from stdin ({fileName, sourceCode, analyzeBodies}) and
+# writes one JSON line per request to stdout: {ok: true, ast} with an AST
+# structure that includes:
+# - All AST nodes with position information (and their text, cut to
+#   _TEXT_PREVIEW_LENGTH characters unless the node kind is in _SYMBOL_KINDS,
+#   so the file is not serialized again for every level of nesting)
+# - Leading comments (including JSDoc)
+# - Trailing comments
+# - Source file metadata
+# or {ok: false, error} if that source could not be parsed. It exits when
+# stdin is closed.
+_BRIDGE_SCRIPT = (
+    f"""
+const fullTextKinds = new Set({json.dumps(sorted(_SYMBOL_KINDS))});
+const previewLength = {_TEXT_PREVIEW_LENGTH};
+"""
+    + """
+const ts = require('typescript');
+const readline = require('readline');
+
+function commentKind(comment) {
+    return comment.kind === ts.SyntaxKind.SingleLineCommentTrivia ? 'single-line' : 'multi-line';
+}
+
+function parse(fileName, sourceCode, analyzeBodies) {
+    // Create a source file
+    const sourceFile = ts.createSourceFile(
+        fileName,
+        sourceCode,
+        ts.ScriptTarget.Latest,
+        true  // setParentNodes - required for comment extraction
+    );
+    const fullText = sourceFile.getFullText();
+
+    // Function to extract AST node with comments
+    function extractNodeWithComments(node) {
+        const kind = ts.SyntaxKind[node.kind];
+        const start = node.getStart(sourceFile);
+        const textEnd = fullTextKinds.has(kind) ? node.end : Math.min(node.end, start + previewLength);
+        const result = {
+            kind: kind,
+            text: fullText.substring(start, textEnd),
+            pos: node.pos,
+            end: node.end,
+            start: start,
+            fullStart: node.getFullStart(),
+        };
+
+        // Extract leading comments (including JSDoc)
+        const leadingComments = ts.getLeadingCommentRanges(fullText, node.getFullStart());
+        if (leadingComments) {
+            result.leadingComments = leadingComments.map(comment => {
+                const commentText = fullText.substring(comment.pos, comment.end);
+                return {
+                    kind: commentKind(comment),
+                    text: commentText,
+                    pos: comment.pos,
+                    end: comment.end,
+                    isJSDoc: comment.kind === ts.SyntaxKind.MultiLineCommentTrivia &&
+                             commentText.trim().startsWith('/**'),
+                };
+            });
+        }
+
+        // Extract trailing comments
+        const trailingComments = ts.getTrailingCommentRanges(fullText, node.end);
+        if (trailingComments) {
+            result.trailingComments = trailingComments.map(comment => ({
+                kind: commentKind(comment),
+                text: fullText.substring(comment.pos, comment.end),
+                pos: comment.pos,
+                end: comment.end,
+            }));
+        }
+
+        return result;
+    }
+
+    // Function to traverse AST and collect all nodes. Unless analyzeBodies is
+    // set, the body of a function-like node (function, method, accessor,
+    // constructor, arrow function) is not descended into.
+    function traverseAST(node, collector) {
+        collector.push(extractNodeWithComments(node));
+        const skipped = !analyzeBodies && ts.isFunctionLike(node) ? node.body : undefined;
+        ts.forEachChild(node, (child) => {
+            if (child !== skipped) {
+                traverseAST(child, collector);
+            }
+        });
+    }
+
+    // Collect all nodes
+    const nodes = [];
+    traverseAST(sourceFile, nodes);
+
+    return {
+        sourceFile: {
+            fileName: sourceFile.fileName,
+            languageVersion: sourceFile.languageVersion,
+            hasNoDefaultLib: sourceFile.hasNoDefaultLib,
+        },
+        nodes: nodes,
+    };
+}
+
+const lines = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+lines.on('line', (line) => {
+    let response;
+    try {
+        const request = JSON.parse(line);
+        response = {
+            ok: true,
+            ast: parse(request.fileName, request.sourceCode, request.analyzeBodies),
+        };
+    } catch (e) {
+        response = { ok: false, error: String(e && e.stack || e) };
+    }
+    process.stdout.write(JSON.stringify(response) + '\\n');
+});
+"""
+)
+
 
 class TypeScriptAnalyzer:
     """
@@ -25,18 +218,80 @@ class TypeScriptAnalyzer:
 
     This analyzer extracts symbols, types, and JSDoc comments from TypeScript
     source files to support automated documentation generation.
+
+    Parsing is done by one Node.js process per analyzer, started on first
+    use and reused for every file, so Node.js startup and loading the
+    TypeScript compiler are paid once. Call close() (or use the analyzer as
+    a context manager) to stop it.
     """
 
-    def __init__(self, ts_compiler_path: str | None = None):
+    def __init__(
+        self,
+        ts_compiler_path: str | None = None,
+        ast_cache_dir: Path | None = None,
+        analyze_bodies: bool = True,
+    ):
         """
         Initialize the TypeScript analyzer.
 
         Args:
             ts_compiler_path: Optional path to TypeScript compiler executable.
                             If not provided, will use 'tsc' from PATH.
+            ast_cache_dir: Optional directory for caching parsed ASTs on disk.
+                            Files whose path and content are unchanged are then
+                            not re-parsed, across analyzer instances and runs.
+            analyze_bodies: Whether to collect the nodes inside function,
+                            method, accessor and constructor bodies. Symbol
+                            declarations and their JSDoc live outside bodies,
+                            so skipping them saves most of the AST output.
         """
         self.ts_compiler_path = ts_compiler_path or "tsc"
+        self.ast_cache_dir = ast_cache_dir
+        self.analyze_bodies = analyze_bodies
         self.logger = logger
+        self._bridge: subprocess.Popen[str] | None = None
+        self._bridge_output: queue.Queue[str | None] | None = None
+        self._bridge_stderr: IO[bytes] | None = None
+        self._bridge_lock = threading.Lock()
+
+    def __enter__(self) -> "TypeScriptAnalyzer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Best effort: interpreter shutdown may already have torn down modules
+        with contextlib.suppress(Exception):
+            self.close()
+
+    def close(self) -> None:
+        """Stop the Node.js parser process, if one is running."""
+        bridge, self._bridge = self._bridge, None
+        stderr, self._bridge_stderr = self._bridge_stderr, None
+        self._bridge_output = None
+        if bridge is not None:
+            try:
+                # Closing stdin ends the bridge's read loop
+                bridge.stdin.close()  # type: ignore[union-attr]
+                bridge.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                bridge.kill()
+                bridge.wait()
+        if stderr is not None:
+            stderr.close()
+
+    def analyze_files(self, file_paths: list[Path]) -> list[dict[str, Any]]:
+        """
+        Analyze several TypeScript files with one Node.js parser process.
+
+        Args:
+            file_paths: Paths to the TypeScript files to analyze
+
+        Returns:
+            One analyze_file result per path, in order
+        """
+        return [self.analyze_file(file_path) for file_path in file_paths]
 
     def analyze_file(self, file_path: Path) -> dict[str, Any]:
         """
@@ -52,6 +307,7 @@ class TypeScriptAnalyzer:
             Dictionary containing:
             - file_path: Path to the analyzed file
             - symbols: List of symbols with integrated JSDoc data (jsdoc field)
+            - symbols_by_kind: Indexes into symbols, grouped by node kind
             - jsdoc_comments: List of all JSDoc comments (for reference)
             - imports: List of import statements
             - exports: List of export statements
@@ -61,15 +317,62 @@ class TypeScriptAnalyzer:
         try:
             # Read the source file
             source_code = file_path.read_text(encoding="utf-8")
+        except Exception:
+            self.logger.exception(
+                "Failed to analyze TypeScript file",
+                extra={"file": str(file_path)},
+            )
+            raise
+
+        return self._analyze(file_path, source_code)
+
+    def analyze_source(
+        self, source_code: str, virtual_path: str | Path = "<memory>.ts"
+    ) -> dict[str, Any]:
+        """
+        Analyze TypeScript source code that is already in memory.
+
+        Same as analyze_file, without reading a file. The virtual path names
+        the source in the result, in log messages and in the AST cache key.
+
+        Args:
+            source_code: TypeScript source code to analyze
+            virtual_path: Path to report for the source
+
+        Returns:
+            Dictionary in the same format as analyze_file
+        """
+        file_path = Path(virtual_path)
+        self.logger.info("Analyzing TypeScript source", extra={"file": str(file_path)})
+        return self._analyze(file_path, source_code)
+
+    def _analyze(self, file_path: Path, source_code: str) -> dict[str, Any]:
+        """
+        Parse source code and extract symbols, JSDoc, imports and exports.
 
-            # Parse AST and extract information
-            ast_data = self._parse_ast(file_path, source_code)
+        Args:
+            file_path: Path of the source (real or virtual)
+            source_code: TypeScript source code
 
-            # Extract symbols and JSDoc comments
+        Returns:
+            Dictionary in the format described in analyze_file
+        """
+        try:
+            # Parse AST (or load it from the cache) and extract information
+            ast_data = self._get_ast(file_path, source_code)
+
+            # Extract symbols and JSDoc comments. A JSDoc comment is attached
+            # to every node starting at the same position and is seen by both
+            # extractors, so each distinct comment is parsed once.
+            jsdoc_cache: dict[str, tuple[str, dict[str, Any]]] = {}
+            symbols = self._extract_symbols(ast_data, jsdoc_cache=jsdoc_cache)
             analysis_result = {
                 "file_path": str(file_path),
-                "symbols": self._extract_symbols(ast_data),
-                "jsdoc_comments": self._extract_jsdoc_comments(ast_data),
+                "symbols": symbols,
+                "symbols_by_kind": self._index_symbols_by_kind(symbols),
+                "jsdoc_comments": self._extract_jsdoc_comments(
+                    ast_data, jsdoc_cache=jsdoc_cache
+                ),
                 "imports": self._extract_imports(ast_data),
                 "exports": self._extract_exports(ast_data),
             }
@@ -85,23 +388,21 @@ class TypeScriptAnalyzer:
 
             return analysis_result
 
-        except Exception as e:
+        except Exception:
             self.logger.exception(
                 "Failed to analyze TypeScript file",
                 extra={"file": str(file_path)},
             )
             raise
 
-    def _parse_ast(self, file_path: Path, source_code: str) -> dict[str, Any]:
+    def _get_ast(self, file_path: Path, source_code: str) -> dict[str, Any]:
         """
-        Parse TypeScript source code into AST using TypeScript compiler API.
+        Return the AST for a source file, using the on-disk cache if configured.
 
-        This method uses the TypeScript compiler API via Node.js to parse
-        the source code and return an AST structure that includes:
-        - All AST nodes with position information
-        - Leading comments (including JSDoc)
-        - Trailing comments
-        - Source file metadata
+        Cache entries are keyed by a SHA-256 digest of the file path, source
+        code and body mode (all of which shape the AST output), so an edited
+        file misses the cache. Unreadable cache entries are treated as misses and
+        failures to write one are logged, never raised.
 
         Args:
             file_path: Path to the source file
@@ -110,118 +411,190 @@ class TypeScriptAnalyzer:
         Returns:
             Dictionary containing parsed AST data
         """
-        # Create a temporary script to extract AST using TypeScript compiler API
-        script_content = f"""
-const ts = require('typescript');
+        if self.ast_cache_dir is None:
+            return self._parse_ast(file_path, source_code)
 
-const sourceCode = {json.dumps(source_code)};
-const fileName = {json.dumps(str(file_path))};
-
-// Create a source file
-const sourceFile = ts.createSourceFile(
-    fileName,
-    sourceCode,
-    ts.ScriptTarget.Latest,
-    true  // setParentNodes - required for comment extraction
-);
-
-// Function to extract AST node with comments
-function extractNodeWithComments(node) {{
-    const result = {{
-        kind: ts.SyntaxKind[node.kind],
-        text: node.getText(sourceFile),
-        pos: node.pos,
-        end: node.end,
-        start: node.getStart(sourceFile),
-        fullStart: node.getFullStart(),
-    }};
-    
-    // Extract leading comments (including JSDoc)
-    const leadingComments = ts.getLeadingCommentRanges(sourceFile.getFullText(), node.getFullStart());
-    if (leadingComments) {{
-        result.leadingComments = leadingComments.map(comment => {{
-            const commentText = sourceFile.getFullText().substring(comment.pos, comment.end);
-            return {{
-                kind: comment.kind === ts.SyntaxKind.SingleLineCommentTrivia ? 'single-line' : 'multi-line',
-                text: commentText,
-                pos: comment.pos,
-                end: comment.end,
-                isJSDoc: comment.kind === ts.SyntaxKind.MultiLineCommentTrivia &&
-                         commentText.trim().startsWith('/**'),
-            }};
-        }});
-    }}
-    
-    // Extract trailing comments
-    const trailingComments = ts.getTrailingCommentRanges(sourceFile.getFullText(), node.end);
-    if (trailingComments) {{
-        result.trailingComments = trailingComments.map(comment => {{
-            return {{
-                kind: comment.kind === ts.SyntaxKind.SingleLineCommentTrivia ? 'single-line' : 'multi-line',
-                text: sourceFile.getFullText().substring(comment.pos, comment.end),
-                pos: comment.pos,
-                end: comment.end,
-            }};
-        }});
-    }}
-    
-    return result;
-}}
-
-// Function to traverse AST and collect all nodes
-function traverseAST(node, collector) {{
-    collector.push(extractNodeWithComments(node));
-    ts.forEachChild(node, (child) => traverseAST(child, collector));
-}}
-
-// Collect all nodes
-const nodes = [];
-traverseAST(sourceFile, nodes);
-
-// Output JSON
-console.log(JSON.stringify({{
-    sourceFile: {{
-        fileName: sourceFile.fileName,
-        languageVersion: sourceFile.languageVersion,
-        hasNoDefaultLib: sourceFile.hasNoDefaultLib,
-    }},
-    nodes: nodes,
-}}, null, 2));
-"""
+        digest = hashlib.sha256(
+            f"{self.analyze_bodies:d}\0{file_path}\0{source_code}".encode(
+                "utf-8", "surrogatepass"
+            )
+        ).hexdigest()
+        cache_file = self.ast_cache_dir / f"{digest}.json"
 
         try:
-            # Execute the Node.js script
-            process = subprocess.run(
-                ["node", "-e", script_content],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=30,
+            with cache_file.open(encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            self.logger.warning(
+                "Ignoring unreadable AST cache entry",
+                extra={"file": str(file_path), "cache_file": str(cache_file)},
             )
 
-            # Parse the JSON output
-            return json.loads(process.stdout)
+        ast_data = self._parse_ast(file_path, source_code)
 
-        except subprocess.TimeoutExpired:
+        try:
+            self.ast_cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename it into place, so a
+            # concurrent reader never sees a partial entry
+            fd, tmp_name = tempfile.mkstemp(dir=self.ast_cache_dir, suffix=".tmp")
+            tmp_file = Path(tmp_name)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(ast_data, f)
+                tmp_file.replace(cache_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
+        except OSError:
+            self.logger.warning(
+                "Failed to write AST cache entry",
+                extra={"file": str(file_path), "cache_file": str(cache_file)},
+            )
+
+        return ast_data
+
+    def _parse_ast(self, file_path: Path, source_code: str) -> dict[str, Any]:
+        """
+        Parse TypeScript source code into AST using TypeScript compiler API.
+
+        This method sends the source code to the analyzer's Node.js bridge
+        (see _BRIDGE_SCRIPT for the AST structure returned). Unless
+        analyze_bodies is set, nodes inside function-like bodies are left out.
+
+        Args:
+            file_path: Path to the source file
+            source_code: Source code content
+
+        Returns:
+            Dictionary containing parsed AST data
+        """
+        request = {
+            "fileName": str(file_path),
+            "sourceCode": source_code,
+            "analyzeBodies": self.analyze_bodies,
+        }
+        with self._bridge_lock:
+            response = self._bridge_request(file_path, request)
+
+        if not response.get("ok"):
+            error = response.get("error")
+            self.logger.error(
+                "Failed to parse AST",
+                extra={"file": str(file_path), "error": error},
+            )
+            raise RuntimeError(f"AST parsing failed: {error}")
+        return response["ast"]
+
+    def _bridge_request(
+        self, file_path: Path, request: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Send one request to the Node.js bridge and wait for its response.
+
+        The bridge is started on first use. If it times out or exits, it is
+        stopped and the next request starts a fresh one.
+
+        Args:
+            file_path: Path to the source file (for logging)
+            request: Parse request to send
+
+        Returns:
+            The bridge's decoded response
+        """
+        if self._bridge is None or self._bridge_output is None:
+            bridge, output = self._start_bridge()
+        else:
+            bridge, output = self._bridge, self._bridge_output
+
+        try:
+            bridge.stdin.write(json.dumps(request) + "\n")  # type: ignore[union-attr]
+            bridge.stdin.flush()  # type: ignore[union-attr]
+            line = output.get(timeout=_PARSE_TIMEOUT)
+        except queue.Empty:
+            self.close()
             self.logger.exception(
                 "AST parsing timed out",
                 extra={"file": str(file_path)},
             )
             raise TimeoutError("AST parsing exceeded timeout") from None
-        except subprocess.CalledProcessError as e:
-            self.logger.exception(
+        except OSError:
+            # The bridge exited before reading the request
+            line = None
+
+        if line is None:
+            stderr = self._read_bridge_stderr()
+            self.close()
+            self.logger.error(
                 "Failed to parse AST",
-                extra={"file": str(file_path), "error": e.stderr},
+                extra={"file": str(file_path), "error": stderr},
             )
-            raise RuntimeError(f"AST parsing failed: {e.stderr}") from e
+            raise RuntimeError(f"AST parsing failed: {stderr}")
+
+        try:
+            return json.loads(line)
         except json.JSONDecodeError as e:
+            self.close()
             self.logger.exception(
                 "Failed to parse AST JSON output",
                 extra={"file": str(file_path)},
             )
             raise RuntimeError(f"Failed to parse AST JSON: {e}") from e
 
-    def _extract_symbols(self, ast_data: dict[str, Any]) -> list[dict[str, Any]]:
+    def _start_bridge(
+        self,
+    ) -> tuple[subprocess.Popen[str], queue.Queue[str | None]]:
+        """Start the Node.js bridge and a thread that queues its output lines."""
+        # Lives as long as the bridge; closed in close()
+        stderr = tempfile.TemporaryFile()  # noqa: SIM115
+        try:
+            bridge = subprocess.Popen(
+                ["node", "-e", _BRIDGE_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                text=True,
+                encoding="utf-8",
+            )
+        except BaseException:
+            stderr.close()
+            raise
+
+        output: queue.Queue[str | None] = queue.Queue()
+
+        def read_output() -> None:
+            # None marks the end of output (the bridge exited)
+            for line in bridge.stdout:  # type: ignore[union-attr]
+                output.put(line)
+            output.put(None)
+
+        threading.Thread(
+            target=read_output, name="ts-analyzer-bridge", daemon=True
+        ).start()
+        self._bridge = bridge
+        self._bridge_output = output
+        self._bridge_stderr = stderr
+        return bridge, output
+
+    def _read_bridge_stderr(self) -> str:
+        """Return what the bridge wrote to stderr, once it has exited."""
+        if self._bridge is None or self._bridge_stderr is None:
+            return ""
+        try:
+            self._bridge.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._bridge.kill()
+            self._bridge.wait()
+        self._bridge_stderr.seek(0)
+        return self._bridge_stderr.read().decode("utf-8", "replace")
+
+    def _extract_symbols(
+        self,
+        ast_data: dict[str, Any],
+        *,
+        jsdoc_cache: dict[str, tuple[str, dict[str, Any]]] | None = None,
+    ) -> list[dict[str, Any]]:
         """
         Extract symbols (functions, classes, interfaces, etc.) from AST.
 
@@ -230,6 +603,7 @@ console.log(JSON.stringify({{
 
         Args:
             ast_data: Parsed AST data
+            jsdoc_cache: Parsed JSDoc comments to reuse (see _parse_jsdoc)
 
         Returns:
             List of extracted symbols with integrated JSDoc documentation
@@ -239,30 +613,52 @@ console.log(JSON.stringify({{
         if "nodes" not in ast_data:
             return symbols
 
+        if jsdoc_cache is None:
+            jsdoc_cache = {}
+
         # First pass: Extract all symbols from AST nodes
         for node in ast_data["nodes"]:
-            symbol_info = self._extract_symbol_info(node)
-            if symbol_info:
-                # Create symbol entry
-                symbol: dict[str, Any] = {
-                    "name": symbol_info.get("name"),
-                    "type": symbol_info.get("type"),
-                    "kind": symbol_info.get("kind"),
-                    "text_preview": symbol_info.get("text_preview"),
-                    "position": symbol_info.get("position"),
-                    "jsdoc": None,  # Will be populated if JSDoc found
-                }
-
-                # Check for associated JSDoc comment
-                jsdoc_data = self._extract_jsdoc_for_node(node)
-                if jsdoc_data:
-                    symbol["jsdoc"] = jsdoc_data
-
+            symbol = self._extract_symbol_info(node)
+            if symbol:
+                # The symbol info already holds the entry's other fields (name,
+                # type, kind, text_preview, position) in order, so it becomes
+                # the entry instead of being copied into a new dict. Attach
+                # the associated JSDoc comment, if any.
+                symbol["jsdoc"] = self._extract_jsdoc_for_node(
+                    node, jsdoc_cache=jsdoc_cache
+                )
                 symbols.append(symbol)
 
         return symbols
 
-    def _extract_jsdoc_for_node(self, node: dict[str, Any]) -> dict[str, Any] | None:
+    @staticmethod
+    def _index_symbols_by_kind(
+        symbols: list[dict[str, Any]],
+    ) -> dict[str, list[int]]:
+        """
+        Group extracted symbols by node kind.
+
+        Lets callers look up, e.g., every ClassDeclaration without scanning
+        the whole symbol list for each kind they need.
+
+        Args:
+            symbols: Symbols returned by _extract_symbols
+
+        Returns:
+            Dictionary mapping each node kind to the indexes of its symbols,
+            in source order
+        """
+        by_kind: dict[str, list[int]] = {}
+        for index, symbol in enumerate(symbols):
+            by_kind.setdefault(symbol["kind"], []).append(index)
+        return by_kind
+
+    def _extract_jsdoc_for_node(
+        self,
+        node: dict[str, Any],
+        *,
+        jsdoc_cache: dict[str, tuple[str, dict[str, Any]]] | None = None,
+    ) -> dict[str, Any] | None:
         """
         Extract and parse JSDoc comment for a specific AST node.
 
@@ -271,6 +667,7 @@ console.log(JSON.stringify({{
 
         Args:
             node: AST node dictionary
+            jsdoc_cache: Parsed JSDoc comments to reuse (see _parse_jsdoc)
 
         Returns:
             Dictionary with JSDoc data (raw_text, normalized_text, tags) or None
@@ -282,8 +679,9 @@ console.log(JSON.stringify({{
         for comment in node.get("leadingComments", []):
             if comment.get("isJSDoc", False):
                 raw_text = comment.get("text", "")
-                normalized_text = self._normalize_comment_text(raw_text)
-                parsed_tags = self._parse_jsdoc_tags(normalized_text)
+                normalized_text, parsed_tags = self._parse_jsdoc(
+                    raw_text, {} if jsdoc_cache is None else jsdoc_cache
+                )
 
                 return {
                     "raw_text": raw_text,
@@ -297,7 +695,62 @@ console.log(JSON.stringify({{
 
         return None
 
-    def _normalize_comment_text(self, comment_text: str) -> str:
+    def _parse_jsdoc(
+        self,
+        raw_text: str,
+        jsdoc_cache: dict[str, tuple[str, dict[str, Any]]],
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Normalize a JSDoc comment and parse its tags, reusing earlier results.
+
+        The result depends only on the raw comment text, so it is cached by
+        text in jsdoc_cache. Each caller gets its own copy of the cached tags,
+        so entries of the analysis result never share mutable data.
+
+        Args:
+            raw_text: Raw JSDoc comment text
+            jsdoc_cache: Results parsed so far, keyed by raw text
+
+        Returns:
+            Tuple of normalized text and parsed tags
+        """
+        parsed = jsdoc_cache.get(raw_text)
+        if parsed is None:
+            normalized_text = self._normalize_comment_text(raw_text)
+            parsed = (normalized_text, self._parse_jsdoc_tags(normalized_text))
+            jsdoc_cache[raw_text] = parsed
+        normalized_text, tags = parsed
+        return normalized_text, self._copy_jsdoc_tags(tags)
+
+    @staticmethod
+    def _copy_jsdoc_tags(tags: dict[str, Any]) -> dict[str, Any]:
+        """
+        Copy a parsed tags dictionary (see _parse_jsdoc_tags).
+
+        Tag values are None, strings, flat dictionaries, or lists of strings
+        or flat dictionaries, so copying two levels down leaves nothing
+        shared; this is much cheaper than copy.deepcopy.
+
+        Args:
+            tags: Parsed tags to copy
+
+        Returns:
+            Independent copy of tags
+        """
+        copied: dict[str, Any] = {}
+        for tag, value in tags.items():
+            if isinstance(value, list):
+                value = [
+                    item.copy() if isinstance(item, dict) else item for item in value
+                ]
+            elif isinstance(value, dict):
+                value = value.copy()
+            copied[tag] = value
+        return copied
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_comment_text(comment_text: str) -> str:
         """
         Normalize JSDoc comment text by removing markers and formatting.
 
@@ -312,41 +765,22 @@ console.log(JSON.stringify({{
 
         Returns:
             Normalized comment text without JSDoc formatting markers
+
+        Results are cached across files: the same license header or
+        boilerplate block recurs throughout a codebase.
         """
         if not comment_text:
             return ""
 
         # Remove JSDoc opening and closing markers
-        normalized = comment_text.strip()
-
-        # Remove /** from the beginning
-        normalized = normalized.removeprefix("/**")
-
-        # Remove */ from the end
-        normalized = normalized.removesuffix("*/")
-
-        # Split into lines and process each
-        lines = normalized.split("\n")
-        normalized_lines = []
-
-        for line in lines:
-            # Strip leading whitespace
-            line = line.strip()
+        body = comment_text.strip().removeprefix("/**").removesuffix("*/")
 
-            # Remove leading asterisk if present (JSDoc format)
-            if line.startswith("*"):
-                line = line[1:].strip()
-
-            # Skip empty lines unless they're part of content structure
-            if line:
-                normalized_lines.append(line)
-            elif (
-                normalized_lines
-            ):  # Preserve intentional blank lines between paragraphs
-                normalized_lines.append("")
-
-        # Join lines back together
-        return "\n".join(normalized_lines).strip()
+        # Strip each line and its leading asterisk (JSDoc format) in one pass.
+        # Blank lines between paragraphs are kept; leading and trailing ones
+        # are removed by the final strip.
+        return "\n".join(
+            [line.strip().removeprefix("*").lstrip() for line in body.split("\n")]
+        ).strip()
 
     def _parse_jsdoc_tags(self, normalized_text: str) -> dict[str, Any]:
         """
@@ -386,21 +820,12 @@ console.log(JSON.stringify({{
             "custom": [],
         }
 
-        if not normalized_text:
+        # Every tag starts with "@"; a comment without one (the common case for
+        # plain descriptions) skips the line-by-line tag scan entirely
+        if "@" not in normalized_text:
             return tags
 
-        # Pattern to match JSDoc tags
-        # Matches: @tagName {type} [name] description or @tagName description
-        # Handles formats like:
-        # - @param {string} name Description
-        # - @param {string} [name] Optional description
-        # - @returns {type} Description
-        # - @deprecated Description
-        tag_pattern = re.compile(
-            r"@(\w+)(?:\s+(?:\{([^}]+)\})?(?:\s*\[?([^\]]+)\]?)?(?:\s+(.+))?)?",
-            re.MULTILINE,
-        )
-
+        match_tag = _JSDOC_TAG_RE.match
         lines = normalized_text.split("\n")
         current_tag: str | None = None
         current_tag_content: list[str] = []
@@ -411,7 +836,7 @@ console.log(JSON.stringify({{
             line = line.strip()
 
             # Check if this line starts a new tag
-            tag_match = tag_pattern.match(line)
+            tag_match = match_tag(line)
             if tag_match:
                 # Save previous tag if any
                 if current_tag and current_tag_content:
@@ -485,13 +910,13 @@ console.log(JSON.stringify({{
         # If name not provided in tag but might be in content
         if not name and content:
             # Check if content starts with {name} pattern
-            name_match = re.match(r"\{([^}]+)\}\s*(.*)", content)
+            name_match = _BRACED_NAME_RE.match(content)
             if name_match:
                 name = name_match.group(1)
                 description = name_match.group(2).strip()
             # Check if content starts with [name] pattern (optional parameter)
             elif content.startswith("[") and "]" in content:
-                bracket_match = re.match(r"\[([^\]]+)\]\s*(.*)", content)
+                bracket_match = _BRACKETED_NAME_RE.match(content)
                 if bracket_match:
                     name = bracket_match.group(1)
                     description = bracket_match.group(2).strip()
@@ -557,23 +982,7 @@ console.log(JSON.stringify({{
         node_kind = node.get("kind", "")
         node_text = node.get("text", "")
 
-        # Common symbol node kinds in TypeScript
-        symbol_kinds = [
-            "FunctionDeclaration",
-            "MethodDeclaration",
-            "ClassDeclaration",
-            "InterfaceDeclaration",
-            "TypeAliasDeclaration",
-            "VariableDeclaration",
-            "PropertyDeclaration",
-            "GetAccessor",
-            "SetAccessor",
-            "Constructor",
-            "EnumDeclaration",
-            "ModuleDeclaration",
-        ]
-
-        if node_kind not in symbol_kinds:
+        if node_kind not in _SYMBOL_KINDS:
             return None
 
         # Extract symbol name (basic extraction - can be enhanced)
@@ -583,26 +992,9 @@ console.log(JSON.stringify({{
         # Try to extract name from node text
         # This is a simplified extraction - full implementation would parse the AST properly
         if node_text:
-            # Look for function/class/interface name patterns
-            # Function: function name(...)
-            # Class: class Name
-            # Interface: interface Name
-            patterns = {
-                "FunctionDeclaration": r"function\s+(\w+)",
-                "MethodDeclaration": r"(\w+)\s*\([^)]*\)",
-                "ClassDeclaration": r"class\s+(\w+)",
-                "InterfaceDeclaration": r"interface\s+(\w+)",
-                "TypeAliasDeclaration": r"type\s+(\w+)",
-                "VariableDeclaration": r"(?:const|let|var)\s+(\w+)",
-                "PropertyDeclaration": r"(\w+)\s*:",
-                "EnumDeclaration": r"enum\s+(\w+)",
-            }
-
-            for pattern_kind, pattern in patterns.items():
-                if node_kind == pattern_kind or node_kind.startswith(
-                    pattern_kind.split("Declaration")[0],
-                ):
-                    match = re.search(pattern, node_text)
+            for kind_prefix, pattern in _SYMBOL_NAME_PATTERNS:
+                if node_kind.startswith(kind_prefix):
+                    match = pattern.search(node_text)
                     if match:
                         symbol_name = match.group(1)
                         break
@@ -611,14 +1003,19 @@ console.log(JSON.stringify({{
             "name": symbol_name,
             "type": symbol_type,
             "kind": node_kind,
-            "text_preview": node_text[:200],  # First 200 chars for context
+            "text_preview": node_text[:_TEXT_PREVIEW_LENGTH],  # Context
             "position": {
                 "start": node.get("start"),
                 "end": node.get("end"),
             },
         }
 
-    def _extract_jsdoc_comments(self, ast_data: dict[str, Any]) -> list[dict[str, Any]]:
+    def _extract_jsdoc_comments(
+        self,
+        ast_data: dict[str, Any],
+        *,
+        jsdoc_cache: dict[str, tuple[str, dict[str, Any]]] | None = None,
+    ) -> list[dict[str, Any]]:
         """
         Extract and normalize JSDoc comments from AST nodes.
 
@@ -629,6 +1026,7 @@ console.log(JSON.stringify({{
 
         Args:
             ast_data: Parsed AST data containing nodes with comments
+            jsdoc_cache: Parsed JSDoc comments to reuse (see _parse_jsdoc)
 
         Returns:
             List of normalized JSDoc comment objects with symbol mapping
@@ -638,17 +1036,19 @@ console.log(JSON.stringify({{
         if "nodes" not in ast_data:
             return jsdoc_comments
 
+        if jsdoc_cache is None:
+            jsdoc_cache = {}
+
         for node in ast_data["nodes"]:
             # Check for leading comments that are JSDoc
             if "leadingComments" in node:
                 for comment in node["leadingComments"]:
                     if comment.get("isJSDoc", False):
-                        # Normalize the comment text
+                        # Normalize the comment text and parse its JSDoc tags
                         raw_text = comment.get("text", "")
-                        normalized_text = self._normalize_comment_text(raw_text)
-
-                        # Parse JSDoc tags from normalized text
-                        parsed_tags = self._parse_jsdoc_tags(normalized_text)
+                        normalized_text, parsed_tags = self._parse_jsdoc(
+                            raw_text, jsdoc_cache
+                        )
 
                         # Extract symbol information from the associated node
                         symbol_info = self._extract_symbol_info(node)
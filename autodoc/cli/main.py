@@ -7,7 +7,6 @@ a Run entity in the database with the is_dry_run flag set appropriately.
 
 import argparse
 import sys
-from datetime import UTC, datetime
 
 from db.models import Run
 from db.session import SessionLocal
@@ -43,7 +42,6 @@ def create_run_from_cli(
             repo=repo,
             branch=branch,
             commit_sha=commit_sha,
-            started_at=datetime.now(UTC),
             status="Awaiting Review",
             correlation_id=correlation_id,
             is_dry_run=is_dry_run,
@@ -9,12 +9,76 @@ Per FR-24 and NFR-3/NFR-4: Graceful error handling with structured error objects
 """
 
 import re
+import sys
 import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from db.models import Template
 
+# Sentinel distinguishing a missing variable from one whose value is None
+_MISSING = object()
+
+# Template formats are resolved to small ints once at the API boundary;
+# internal code branches on the int rather than comparing strings.
+_MARKDOWN = 0
+_STORAGE = 1
+_FORMAT_IDS = {"Markdown": _MARKDOWN, "Storage": _STORAGE}
+
+# Root element declaring the Confluence Storage Format namespace prefixes.
+# Fed to the parser around the rendered output instead of concatenated.
+_NS_ROOT_OPEN = (
+    '<root xmlns:ac="http://atlassian.com/content" '
+    'xmlns:ri="http://atlassian.com/rich">'
+)
+_NS_ROOT_CLOSE = "</root>"
+
+
+@lru_cache(maxsize=2048)
+def _parse_key(raw: str) -> tuple[str, tuple[str, ...]]:
+    """Strip a placeholder body and split it into its dotted path.
+
+    Cached across templates, since the same keys recur in many of them.
+    The key and its segments are interned so lookups against the (usually
+    interned) literal keys of variable dicts hit the identity fast path.
+
+    Args:
+        raw: Text between the braces of a placeholder (e.g., " symbol.name ")
+
+    Returns:
+        Tuple of (key, path), e.g. ("symbol.name", ("symbol", "name"))
+    """
+    key = sys.intern(raw.strip())
+    return key, tuple(sys.intern(part) for part in key.split("."))
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledTemplate:
+    """A template body split into output layout and placeholder references.
+
+    Distinct placeholders are stored column-wise and split by how often the
+    render loop reads them: the (key, path) pairs it walks on every render
+    sit in one column, the original texts only needed for missing variables
+    in another, so the hot loop never builds or unpacks the cold data.
+
+    Attributes:
+        layout: Output pieces in order: literal text (possibly "") at even
+            positions, "" at the odd positions that placeholders fill
+        order: Placeholder index for each occurrence, or None when every
+            placeholder occurs once (occurrence n uses placeholder n)
+        lookups: (key, path) of each distinct placeholder, in order of first
+            appearance: the stripped key and the key pre-split on "."
+        texts: Original text of each distinct placeholder, kept as-is when
+            the variable is missing
+    """
+
+    layout: tuple[str, ...]
+    order: tuple[int, ...] | None
+    lookups: tuple[tuple[str, tuple[str, ...]], ...]
+    texts: tuple[str, ...]
+
 
 class TemplateError(Exception):
     """Base exception for template engine errors.
@@ -47,6 +111,9 @@ class TemplateError(Exception):
     def to_dict(self) -> dict[str, Any]:
         """Convert error to structured dictionary for logging/storage.
 
+        Built on every call: attributes such as template_id may be set after
+        the error is created, and callers may modify the returned dictionary.
+
         Returns:
             Dictionary with error details
         """
@@ -102,16 +169,21 @@ class TemplateEngine:
 
     Per FR-24 and NFR-3/NFR-4: Graceful error handling with structured exceptions.
 
+    Compiled templates are cached on the class and shared by every caller,
+    so the engine holds no per-instance state and there is nothing to gain
+    from creating instances; call the classmethods directly.
+
     Example:
-        >>> engine = TemplateEngine()
         >>> template = "Hello {{name}}!"
         >>> variables = {"name": "World"}
-        >>> engine.render(template, variables, "Markdown")
+        >>> TemplateEngine.render(template, "Markdown", variables)
         'Hello World!'
     """
 
-    # Pattern to match {{variable}} or {{object.property}} placeholders
-    PLACEHOLDER_PATTERN = re.compile(r"\{\{([^}]+)\}\}")
+    # Pattern to match {{variable}} or {{object.property}} placeholders.
+    # The body excludes both braces so a failed match stops at the next brace
+    # instead of rescanning up to a distant "}" (linear time on any input).
+    PLACEHOLDER_PATTERN = re.compile(r"\{\{([^{}]+)\}\}")
 
     @classmethod
     def render(
@@ -145,70 +217,11 @@ class TemplateEngine:
         """
         try:
             # Validate format first
-            if format not in ("Markdown", "Storage"):
-                raise UnsupportedFormatError(
-                    f"Invalid template format: {format}. Must be 'Markdown' or 'Storage'",
-                    template_id=template_id,
-                    format=format,
-                )
-
-            # Validate template syntax (check for malformed placeholders)
-            cls._validate_template_syntax(template_body, template_id)
-
-            def replace_placeholder(match: re.Match[str]) -> str:
-                """Replace a single placeholder with its value."""
-                try:
-                    placeholder = match.group(1).strip()
-
-                    # Validate placeholder syntax
-                    if not placeholder:
-                        raise TemplateSyntaxError(
-                            "Empty placeholder found in template",
-                            template_id=template_id,
-                        )
-
-                    value, found = cls._get_nested_value(variables, placeholder)
-
-                    if not found:
-                        if strict_mode:
-                            raise MissingVariableError(
-                                f"Required variable '{placeholder}' is missing from context",
-                                template_id=template_id,
-                                variable=placeholder,
-                            )
-                        # Variable not found - leave placeholder unchanged (non-strict)
-                        return match.group(0)
-
-                    # Convert value to string (including None -> "None")
-                    return str(value)
-                except (TemplateSyntaxError, MissingVariableError):
-                    # Re-raise structured exceptions
-                    raise
-                except Exception as e:
-                    # Wrap unexpected errors
-                    raise TemplateSyntaxError(
-                        f"Error processing placeholder: {e!s}",
-                        template_id=template_id,
-                        variable=match.group(1).strip() if match else None,
-                    ) from e
+            format_id = cls._validate_format(format, template_id)
 
-            # Replace all placeholders
-            try:
-                rendered = cls.PLACEHOLDER_PATTERN.sub(
-                    replace_placeholder, template_body
-                )
-            except re.error as e:
-                # Invalid regex pattern (shouldn't happen with our pattern, but catch anyway)
-                raise TemplateSyntaxError(
-                    f"Invalid template pattern: {e!s}",
-                    template_id=template_id,
-                ) from e
-
-            # Validate Storage Format XML after rendering
-            if format == "Storage":
-                cls._validate_storage_format(rendered, template_id)
-
-            return rendered
+            return cls._render_body(
+                template_body, format_id, variables, template_id, strict_mode
+            )
 
         except (UnsupportedFormatError, TemplateSyntaxError, MissingVariableError):
             # Re-raise our structured exceptions
@@ -220,37 +233,279 @@ class TemplateEngine:
                 template_id=template_id,
             ) from e
 
+    @classmethod
+    def render_many(
+        cls,
+        template_bodies: list[str],
+        format: str,  # noqa: A002
+        variables: dict[str, Any],
+        strict_mode: bool = False,
+    ) -> list[str]:
+        """Render several templates against the same variables.
+
+        Equivalent to calling render() for each body, but the format is
+        validated once for the whole batch, each body reuses its cached
+        compiled tokens, and each key is looked up and converted to a string
+        once for the whole batch.
+
+        Args:
+            template_bodies: Template contents with placeholders
+            format: Template format ("Markdown" or "Storage") for every body
+            variables: Dictionary of variables to substitute
+            strict_mode: If True, raise MissingVariableError for missing variables
+
+        Returns:
+            Rendered templates, in the same order as template_bodies
+
+        Raises:
+            UnsupportedFormatError: If format is not "Markdown" or "Storage"
+            TemplateSyntaxError: If a template has invalid placeholder syntax
+            MissingVariableError: If strict_mode=True and a required variable is missing
+        """
+        try:
+            format_id = cls._validate_format(format, None)
+
+            # Shared across the batch: key -> rendered value string
+            value_cache: dict[str, str] = {}
+            return [
+                cls._render_body(
+                    body,
+                    format_id,
+                    variables,
+                    None,
+                    strict_mode,
+                    value_cache=value_cache,
+                )
+                for body in template_bodies
+            ]
+
+        except (UnsupportedFormatError, TemplateSyntaxError, MissingVariableError):
+            raise
+        except Exception as e:
+            raise TemplateSyntaxError(
+                f"Unexpected error during template rendering: {e!s}",
+            ) from e
+
+    @classmethod
+    def _validate_format(cls, format: str, template_id: int | None) -> int:  # noqa: A002
+        """Resolve a format name to its internal id.
+
+        Raises:
+            UnsupportedFormatError: If format is not "Markdown" or "Storage"
+        """
+        format_id = _FORMAT_IDS.get(format)
+        if format_id is None:
+            raise UnsupportedFormatError(
+                f"Invalid template format: {format}. Must be 'Markdown' or 'Storage'",
+                template_id=template_id,
+                format=format,
+            )
+        return format_id
+
+    @classmethod
+    def _render_body(
+        cls,
+        template_body: str,
+        format_id: int,
+        variables: dict[str, Any],
+        template_id: int | None,
+        strict_mode: bool,
+        *,
+        value_cache: dict[str, str] | None = None,
+    ) -> str:
+        """Validate, substitute and (for Storage) check one template body.
+
+        format_id is the internal id returned by _validate_format; value_cache
+        is an optional key -> value string cache shared by a batch render.
+        """
+        # Syntax and static Storage checks are cached per body; failures are
+        # not cached and carry no template ID yet
+        try:
+            # Fast path: with no braces there is nothing to substitute or
+            # mis-nest, and the body is the rendered output as-is
+            if "{{" not in template_body and "}}" not in template_body:
+                if format_id == _STORAGE:
+                    cls._validate_static_storage(template_body)
+                return template_body
+
+            compiled = cls._compile(template_body)
+        except TemplateSyntaxError as e:
+            e.template_id = template_id
+            raise
+
+        rendered = cls._render_tokens(
+            compiled, variables, template_id, strict_mode, value_cache=value_cache
+        )
+
+        # Validate Storage Format XML after rendering
+        if format_id == _STORAGE:
+            cls._validate_storage_format(rendered, template_id)
+
+        return rendered
+
+    @classmethod
+    def _render_tokens(
+        cls,
+        compiled: _CompiledTemplate,
+        variables: dict[str, Any],
+        template_id: int | None,
+        strict_mode: bool,
+        *,
+        value_cache: dict[str, str] | None = None,
+    ) -> str:
+        """Build the output of a compiled template, substituting placeholders.
+
+        This is the per-render hot loop. Each unique key is resolved once,
+        however often it appears; dotted keys were split at compile time, so
+        resolving one is a dict check per segment. The literal layout is
+        copied as a whole and only placeholder slots are filled in before a
+        single join, so literal text costs no per-piece Python work. join
+        sums the piece lengths and allocates the output once; a growable
+        buffer such as io.StringIO would need a Python-level write per piece.
+
+        Args:
+            compiled: Compiled template from _compile
+            variables: Dictionary of variables to substitute
+            template_id: Optional template ID for error reporting
+            strict_mode: If True, raise MissingVariableError for missing variables
+            value_cache: Optional key -> value string cache, read and filled
+                here, for renders sharing the same variables
+
+        Returns:
+            Rendered template text
+
+        Raises:
+            TemplateSyntaxError: If a placeholder is empty or its value cannot
+                be converted to a string
+            MissingVariableError: If strict_mode=True and a variable is missing
+        """
+        resolved: list[str] = []
+        append = resolved.append
+        for key, path in compiled.lookups:
+            if not key:
+                raise TemplateSyntaxError(
+                    "Empty placeholder found in template",
+                    template_id=template_id,
+                )
+
+            if value_cache is not None:
+                cached = value_cache.get(key)
+                if cached is not None:
+                    append(cached)
+                    continue
+
+            # Walk the pre-split path; a missing key or a non-dict is missing.
+            # The "in" check keeps dict subclasses such as defaultdict from
+            # inventing (and inserting) values for missing keys.
+            value = variables
+            for part in path:
+                if not isinstance(value, dict) or part not in value:
+                    value = _MISSING
+                    break
+                value = value[part]
+
+            if value is _MISSING:
+                if strict_mode:
+                    raise MissingVariableError(
+                        f"Required variable '{key}' is missing from context",
+                        template_id=template_id,
+                        variable=key,
+                    )
+                # Variable not found - leave placeholder unchanged (non-strict);
+                # resolved holds one entry per placeholder handled so far
+                append(compiled.texts[len(resolved)])
+                continue
+
+            # Convert value to string (including None -> "None"). str() is used
+            # rather than str.format_map: format_map reads dotted names as
+            # attributes, needs literal braces escaped and calls __format__,
+            # which need not match __str__.
+            try:
+                string = str(value)
+            except Exception as e:
+                # Wrap unexpected errors from a value's __str__
+                raise TemplateSyntaxError(
+                    f"Error processing placeholder: {e!s}",
+                    template_id=template_id,
+                    variable=key,
+                ) from e
+            append(string)
+            if value_cache is not None:
+                value_cache[key] = string
+
+        parts = list(compiled.layout)
+        if compiled.order is None:
+            parts[1::2] = resolved
+        else:
+            parts[1::2] = [resolved[slot] for slot in compiled.order]
+        return "".join(parts)
+
     @classmethod
     def _validate_template_syntax(
         cls, template_body: str, template_id: int | None
-    ) -> None:
+    ) -> list[tuple[int, int]]:
         """Validate template syntax for common errors.
 
+        The brace scan that validates the template also locates every
+        placeholder, so compiling needs no second pass over the text.
+
         Args:
             template_body: Template content to validate
             template_id: Optional template ID for error reporting
 
+        Returns:
+            (start, end) offsets of each '{{' and of the '}}' closing it
+
         Raises:
             TemplateSyntaxError: If template has invalid syntax
         """
-        # Check for unclosed placeholders (e.g., {{ without }})
-        open_braces = template_body.count("{{")
-        close_braces = template_body.count("}}")
-
-        if open_braces != close_braces:
-            raise TemplateSyntaxError(
-                f"Mismatched placeholder braces: found {open_braces} opening '{{{{' "
-                f"but {close_braces} closing '}}'",
-                template_id=template_id,
-            )
-
-        # Check for nested placeholders (e.g., {{{{var}}}} which is invalid)
+        # Check for nested placeholders (e.g., {{{{var}}}} which is invalid).
+        # Done first: it is a cheap substring scan and rejects the input before
+        # any brace counting or placeholder matching runs.
         if "{{{{" in template_body or "}}}}" in template_body:
             raise TemplateSyntaxError(
                 "Invalid nested placeholder syntax detected",
                 template_id=template_id,
             )
 
+        # Check that every '{{' is closed by a '}}' before the next '{{' and that
+        # no '}}' appears without an opener. A linear str.find scan: each
+        # opener is paired with the first closer after it.
+        spans: list[tuple[int, int]] = []
+        find = template_body.find
+        pos = 0
+        while True:
+            start = find("{{", pos)
+            stray = find("}}", pos, len(template_body) if start == -1 else start)
+            if stray != -1:
+                raise TemplateSyntaxError(
+                    f"Mismatched placeholder braces: closing '}}}}' at position "
+                    f"{stray} has no opening '{{{{'",
+                    template_id=template_id,
+                )
+            if start == -1:
+                return spans
+
+            end = find("}}", start + 2)
+            if end == -1 or find("{{", start + 2, end) != -1:
+                raise TemplateSyntaxError(
+                    f"Mismatched placeholder braces: opening '{{{{' at position "
+                    f"{start} is not closed by '}}}}'",
+                    template_id=template_id,
+                )
+            spans.append((start, end))
+            pos = end + 2
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _validate_static_storage(cls, template_body: str) -> None:
+        """Validate a placeholder-free Storage body, caching successful checks.
+
+        Raises:
+            TemplateSyntaxError: If XML is not well-formed (without a template ID)
+        """
+        cls._validate_storage_format(template_body, None)
+
     @classmethod
     def _validate_storage_format(cls, rendered: str, template_id: int | None) -> None:
         """Validate that rendered Storage Format output is well-formed XML.
@@ -270,12 +525,11 @@ class TemplateEngine:
             # Confluence Storage Format uses namespaces (ac:, ri:, etc.)
             # We need to handle namespace prefixes. Try wrapping in a root element
             # with namespace declarations for validation
-            wrapped_xml = (
-                '<root xmlns:ac="http://atlassian.com/content" '
-                'xmlns:ri="http://atlassian.com/rich">'
-                f"{rendered}</root>"
-            )
-            ET.fromstring(wrapped_xml)
+            parser = ET.XMLParser()
+            parser.feed(_NS_ROOT_OPEN)
+            parser.feed(rendered)
+            parser.feed(_NS_ROOT_CLOSE)
+            parser.close()
         except ET.ParseError as e:
             # If wrapping fails, try parsing directly (might work for simple XML)
             try:
@@ -295,34 +549,68 @@ class TemplateEngine:
             ) from e
 
     @classmethod
-    def _get_nested_value(cls, context: dict[str, Any], path: str) -> tuple[Any, bool]:
-        """Get a value from a nested dictionary using dot notation.
+    @lru_cache(maxsize=256)
+    def _compile(cls, template_body: str) -> _CompiledTemplate:
+        """Validate a template body and split it into literal text and placeholders.
+
+        Keys and their path segments are interned. Results are cached per
+        template body; invalid bodies raise and are not cached.
 
         Args:
-            context: The variable context dictionary
-            path: Dot-separated path (e.g., "symbol.name")
+            template_body: Template content with placeholders
 
         Returns:
-            Tuple of (value, found) where found indicates if the path exists.
-            If found is False, the value is None and the variable is missing.
-            If found is True, the value may be None (variable exists but is None).
-        """
-        parts = path.split(".")
-        current: Any = context
-
-        for part in parts:
-            if not isinstance(current, dict):
-                return (None, False)
-
-            if part not in current:
-                return (None, False)
+            The compiled template
 
-            current = current[part]
-
-        return (current, True)
+        Raises:
+            TemplateSyntaxError: If template has invalid placeholder syntax
+                (raised without a template ID)
+        """
+        # Validate template syntax (check for malformed placeholders); the
+        # same scan yields the placeholder offsets
+        spans = cls._validate_template_syntax(template_body, None)
+        placeholders = [
+            (start, end + 2, template_body[start + 2 : end]) for start, end in spans
+        ]
+        if any(not raw or "{" in raw or "}" in raw for _, _, raw in placeholders):
+            # A brace inside a pair (e.g. "{{{a}}") or an empty pair: let
+            # PLACEHOLDER_PATTERN decide which text is a placeholder
+            placeholders = [
+                (match.start(), match.end(), match.group(1))
+                for match in cls.PLACEHOLDER_PATTERN.finditer(template_body)
+            ]
+
+        layout: list[str] = []
+        order: list[int] = []
+        lookups: list[tuple[str, tuple[str, ...]]] = []
+        texts: list[str] = []
+        index: dict[str, int] = {}
+        pos = 0
+        for start, stop, raw in placeholders:
+            layout.append(template_body[pos:start])
+            layout.append("")
+            text = template_body[start:stop]
+            if text not in index:
+                index[text] = len(texts)
+                # _parse_key's cached tuple is shared, not rebuilt per template
+                lookups.append(_parse_key(raw))
+                texts.append(text)
+            order.append(index[text])
+            pos = stop
+        layout.append(template_body[pos:])
+
+        # The common case of no repeated placeholder needs no index mapping
+        unique = len(order) == len(texts)
+        return _CompiledTemplate(
+            layout=tuple(layout),
+            order=None if unique else tuple(order),
+            lookups=tuple(lookups),
+            texts=tuple(texts),
+        )
 
+    @classmethod
     def render_template(
-        self,
+        cls,
         template: "Template",
         variables: dict[str, Any],
         strict_mode: bool = False,
@@ -345,6 +633,6 @@ class TemplateEngine:
             TemplateSyntaxError: If template has invalid placeholder syntax
             MissingVariableError: If strict_mode=True and a required variable is missing
         """
-        return self.__class__.render(
+        return cls.render(
             template.body, template.format, variables, template.id, strict_mode
         )
@@ -1,6 +1,8 @@
 """Security middleware for masking sensitive data in logs (FR-28, NFR-9)."""
 
 import logging
+import re
+
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -21,6 +23,36 @@ SENSITIVE_FIELDS = [
     "x-api-key",
 ]
 
+# Path fragments of endpoints whose traffic may carry credentials
+_SENSITIVE_PATHS = ("/connections", "/login", "/auth", "/api-key")
+
+# Masking patterns are compiled once at import rather than looked up in re's
+# cache on every call; each pass is skipped when a substring check shows it
+# cannot match.
+_MASK = "••••••••"
+_ATATT_TOKEN_RE = re.compile(r"ATATT[A-Za-z0-9_-]+")
+_ATATT_API_TOKEN_RE = re.compile(r"ATATT[A-Za-z0-9_-]{20,}")
+_TOKEN_LIKE_RE = re.compile(r"[A-Za-z0-9_-]{20,}")
+_TOKEN_LIKE_WORD_RE = re.compile(r"\b[A-Za-z0-9_-]{20,}\b")
+_SECRET_ASSIGNMENT_RE = re.compile(
+    r"(token|api_token|password|secret|api_key|access_token|refresh_token|auth_token)\s*[=:]\s*[A-Za-z0-9_-]{10,}",
+    re.IGNORECASE,
+)
+
+
+def _truncate_token(match: re.Match[str]) -> str:
+    """Keep the first 8 characters of a token-like match longer than 20."""
+    value = match.group()
+    return value[:8] + _MASK if len(value) > 20 else value
+
+
+def _mask_assignment(match: re.Match[str]) -> str:
+    """Replace the value of a "name=value" or "name: value" match."""
+    value = match.group()
+    if "=" in value:
+        return value.split("=")[0] + "=" + _MASK
+    return value.split(":")[0] + ":" + _MASK
+
 
 class SecurityLoggingMiddleware(BaseHTTPMiddleware):
     """
@@ -109,8 +141,8 @@ class SecurityLoggingMiddleware(BaseHTTPMiddleware):
 
     def _is_sensitive_endpoint(self, path: str) -> bool:
         """Check if endpoint might contain sensitive data."""
-        sensitive_paths = ["/connections", "/login", "/auth", "/api-key"]
-        return any(sensitive_path in path.lower() for sensitive_path in sensitive_paths)
+        path_lower = path.lower()
+        return any(sensitive_path in path_lower for sensitive_path in _SENSITIVE_PATHS)
 
     def _mask_headers(self, headers: dict[str, str]) -> dict[str, str]:
         """Mask sensitive header values."""
@@ -124,17 +156,13 @@ class SecurityLoggingMiddleware(BaseHTTPMiddleware):
     def _mask_string(self, text: str) -> str:
         """Mask any sensitive patterns in a string."""
         masked = text
-        # Simple heuristic: mask if contains token-like patterns
-        import re
-
         # Mask token patterns (e.g., ATATT...)
-        masked = re.sub(r"ATATT[A-Za-z0-9_-]+", "ATATT••••••••", masked)
-        # Mask other token-like patterns
-        return re.sub(
-            r"[A-Za-z0-9_-]{20,}",
-            lambda m: m.group()[:8] + "••••••••" if len(m.group()) > 20 else m.group(),
-            masked,
-        )
+        if "ATATT" in masked:
+            masked = _ATATT_TOKEN_RE.sub("ATATT" + _MASK, masked)
+        # Mask other token-like patterns (20+ chars)
+        if len(masked) < 20:
+            return masked
+        return _TOKEN_LIKE_RE.sub(_truncate_token, masked)
 
 
 def mask_exception_message(exception: Exception) -> str:
@@ -151,23 +179,13 @@ def mask_exception_message(exception: Exception) -> str:
     """
     message = str(exception)
 
-    # Mask common sensitive patterns
-    import re
-
     # Mask Confluence API token patterns (ATATT...)
-    message = re.sub(r"ATATT[A-Za-z0-9_-]{20,}", "ATATT••••••••", message)
+    if "ATATT" in message:
+        message = _ATATT_API_TOKEN_RE.sub("ATATT" + _MASK, message)
     # Mask long alphanumeric strings that might be tokens (20+ chars)
-    message = re.sub(
-        r"\b[A-Za-z0-9_-]{20,}\b",
-        lambda m: m.group()[:8] + "••••••••" if len(m.group()) > 20 else m.group(),
-        message,
-    )
+    if len(message) >= 20:
+        message = _TOKEN_LIKE_WORD_RE.sub(_truncate_token, message)
     # Mask patterns like "token=..." or "api_token=..."
-    return re.sub(
-        r"(token|api_token|password|secret|api_key|access_token|refresh_token|auth_token)\s*[=:]\s*[A-Za-z0-9_-]{10,}",
-        lambda m: m.group().split("=")[0] + "=••••••••"
-        if "=" in m.group()
-        else m.group().split(":")[0] + ":••••••••",
-        message,
-        flags=re.IGNORECASE,
-    )
+    if "=" not in message and ":" not in message:
+        return message
+    return _SECRET_ASSIGNMENT_RE.sub(_mask_assignment, message)
@@ -4,39 +4,87 @@ from __future__ import annotations
 from typing import Any
 
 
+# Fully masked value; also the minimum masked width for partial masking
+_MASK = "•" * 10
+
+
 def mask_token(token: str | None, visible_chars: int = 0) -> str:
     """Return a masked version of a token suitable for logging."""
 
-    if not token:
-        return "••••••••••"
+    if not token or visible_chars <= 0:
+        return _MASK
 
     token = str(token)
-    if visible_chars <= 0 or visible_chars >= len(token):
-        return "••••••••••"
+    hidden = len(token) - visible_chars
+    if hidden <= 0:
+        return _MASK
+    if hidden <= len(_MASK):
+        return token[:visible_chars] + _MASK
+    return token[:visible_chars] + "•" * hidden
 
-    visible = token[:visible_chars]
-    return f"{visible}{'•' * max(10, len(token) - visible_chars)}"
+
+# Keys masked by mask_payload when no explicit key list is given
+_DEFAULT_SENSITIVE_KEYS = frozenset(
+    {"token", "api_token", "password", "secret", "api_key"}
+)
 
 
 def mask_payload(
     payload: dict[str, Any], keys: list[str] | None = None, deep: bool = False
 ) -> dict[str, Any]:
-    """Return a shallow copy of a payload with sensitive fields masked."""
+    """Return a shallow copy of a payload with sensitive fields masked.
+
+    With ``deep=True`` nested dictionaries are copied and masked too. They
+    are walked with an explicit stack rather than recursion, and a dict
+    reachable more than once (including a cycle) is copied once.
+
+    A payload without any sensitive key is returned as-is, not copied, so
+    callers must not mutate the result.
+    """
+
+    sensitive = _DEFAULT_SENSITIVE_KEYS if keys is None else frozenset(keys)
+    if not _has_sensitive_key(payload, sensitive, deep):
+        return payload
+
+    masked: dict[str, Any] = {}
+    copies = {id(payload): masked}
+    stack = [(payload, masked)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if value is not None and key in sensitive:
+                target[key] = _MASK
+            elif deep and isinstance(value, dict):
+                nested = copies.get(id(value))
+                if nested is None:
+                    nested = copies[id(value)] = {}
+                    stack.append((value, nested))
+                target[key] = nested
+            else:
+                target[key] = value
 
-    if keys is None:
-        keys = ["token", "api_token", "password", "secret", "api_key"]
+    return masked
 
-    masked = payload.copy()
-    for key in keys:
-        if key in masked and masked[key] is not None:
-            masked[key] = mask_token(str(masked[key]))
 
-    if deep:
-        for key, value in masked.items():
-            if isinstance(value, dict):
-                masked[key] = mask_payload(value, keys=keys, deep=True)
+def _has_sensitive_key(
+    payload: dict[str, Any], sensitive: frozenset[str], deep: bool
+) -> bool:
+    """Check whether a payload (and, if deep, any nested dict) has a sensitive key."""
+    if not sensitive.isdisjoint(payload):
+        return True
+    if not deep:
+        return False
 
-    return masked
+    seen = {id(payload)}
+    stack = [payload]
+    while stack:
+        for value in stack.pop().values():
+            if isinstance(value, dict) and id(value) not in seen:
+                if not sensitive.isdisjoint(value):
+                    return True
+                seen.add(id(value))
+                stack.append(value)
+    return False
 
 
 def mask_dict_keys(data: dict[str, Any], keys: list[str]) -> dict[str, Any]:
@@ -44,7 +92,7 @@ def mask_dict_keys(data: dict[str, Any], keys: list[str]) -> dict[str, Any]:
     masked = data.copy()
     for key in keys:
         if key in masked and masked[key] is not None:
-            masked[key] = mask_token(str(masked[key]))
+            masked[key] = _MASK
     return masked
 
 
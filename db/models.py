@@ -36,7 +36,9 @@ class Run(Base):
         nullable=False,
         index=True,
     )  # Index per requirements
-    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     status: Mapped[str] = mapped_column(
         Text,
@@ -50,6 +52,7 @@ class Run(Base):
         Text,
         nullable=False,
         default="PRODUCTION",
+        server_default="PRODUCTION",
     )
 
     # Relationships with cascade delete
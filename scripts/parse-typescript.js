@@ -9,9 +9,13 @@
  * Usage:
  *   node parse-typescript.js <file-path>
  *   echo "<code>" | node parse-typescript.js
+ *   node parse-typescript.js --server
  * 
  * Output: JSON AST to stdout
  * Errors: JSON error object to stderr
+ *
+ * With --server, the script keeps running and serves one request per line
+ * of stdin (see serve()), so many files are parsed by one Node.js process.
  */
 
 const fs = require('fs');
@@ -95,11 +99,65 @@ function getSourceCode(input) {
   }
 }
 
+/**
+ * Server mode: read one JSON request per line from stdin and write one
+ * single-line JSON result (as returned by parseTypeScript) per request to
+ * stdout. Requests are {"filePath": "..."} or {"sourceCode": "..."}.
+ * Empty or whitespace-only source is rejected with EMPTY_INPUT, as in main().
+ * The server exits when stdin is closed.
+ */
+function serve() {
+  const rl = require('readline').createInterface({
+    input: process.stdin,
+    crlfDelay: Infinity
+  });
+
+  rl.on('line', (line) => {
+    let result;
+    try {
+      const request = JSON.parse(line);
+      let sourceCode = request.sourceCode;
+      if (request.filePath !== undefined) {
+        try {
+          sourceCode = fs.readFileSync(request.filePath, 'utf8');
+        } catch (error) {
+          throw new Error(`Cannot read file: ${request.filePath}: ${error.message}`);
+        }
+      }
+      if (!sourceCode || sourceCode.trim().length === 0) {
+        result = {
+          success: false,
+          error: {
+            type: 'EMPTY_INPUT',
+            message: 'Source code is empty'
+          }
+        };
+      } else {
+        result = parseTypeScript(sourceCode);
+      }
+    } catch (error) {
+      result = {
+        success: false,
+        error: {
+          type: 'REQUEST_ERROR',
+          message: error.message
+        }
+      };
+    }
+    process.stdout.write(JSON.stringify(result) + '\n');
+  });
+}
+
 /**
  * Main execution
  */
 function main() {
   const args = process.argv.slice(2);
+
+  if (args[0] === '--server') {
+    serve();
+    return;
+  }
   
   // Get file path from command line or stdin
   const input = args[0] || null;
@@ -131,5 +189,5 @@ if (require.main === module) {
 }
 
 // Export for testing
-module.exports = { parseTypeScript, getSourceCode };
+module.exports = { parseTypeScript, getSourceCode, serve };
 
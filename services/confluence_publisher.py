@@ -33,6 +33,11 @@ class ConfluencePublisher:
         self._client = client
         self._rollback_registry = rollback_registry or PageRollbackRegistry()
         self._run_mode = run_mode
+        if run_mode == "TEST":
+            # Specialize once for the fixed mode: the TEST-mode variants shadow
+            # the real operations on this instance, so no call re-checks it.
+            self.update_page = self._test_update_page  # type: ignore[method-assign]
+            self.create_page = self._test_create_page  # type: ignore[method-assign]
 
     @property
     def rollback_registry(self) -> PageRollbackRegistry:
@@ -42,13 +47,6 @@ class ConfluencePublisher:
     def update_page(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Update a Confluence page after recording the previous snapshot."""
 
-        if self._run_mode == "TEST":
-            logger.info(
-                "TEST MODE: Skipping Confluence page update for page %s",
-                payload.get("id"),
-            )
-            return {"id": payload.get("id"), "status": "test_mode_skipped"}
-
         page_id = payload.get("id")
         if not page_id:
             msg = "update payload must include 'id'"
@@ -113,13 +111,6 @@ class ConfluencePublisher:
 
     def create_page(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Create a Confluence page. The resulting snapshot is tracked for rollback."""
-        if self._run_mode == "TEST":
-            logger.info(
-                "TEST MODE: Skipping Confluence page creation for page %s",
-                payload.get("id"),
-            )
-            return {"id": payload.get("id"), "status": "test_mode_skipped"}
-
         try:
             result = self._client.create_page(payload)
         except Exception as exc:
@@ -182,6 +173,22 @@ class ConfluencePublisher:
             )
         return result
 
+    def _test_update_page(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """TEST-mode update_page: log and skip the Confluence call."""
+        logger.info(
+            "TEST MODE: Skipping Confluence page update for page %s",
+            payload.get("id"),
+        )
+        return {"id": payload.get("id"), "status": "test_mode_skipped"}
+
+    def _test_create_page(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """TEST-mode create_page: log and skip the Confluence call."""
+        logger.info(
+            "TEST MODE: Skipping Confluence page creation for page %s",
+            payload.get("id"),
+        )
+        return {"id": payload.get("id"), "status": "test_mode_skipped"}
+
     def _restore_snapshot(self, snapshot: PageSnapshot) -> dict[str, Any]:
         """Restore the provided snapshot using the client update operation."""
         restore_payload: dict[str, Any] = {
@@ -9,12 +9,67 @@ Per NFR-10: Output sanitization to prevent script injection.
 
 import logging
 import re
+import threading
 import xml.etree.ElementTree as ET
-from html import escape as html_escape
+from functools import lru_cache
 from typing import Any
 
+try:
+    from lxml import etree as _LET
+except ImportError:
+    # lxml not installed, validate with xml.etree.ElementTree instead
+    _LET = None
+
 logger = logging.getLogger(__name__)
 
+# Single-pass translation table for Storage Format escaping. Produces the same
+# entities as html.escape(value, quote=True) without its five chained replaces.
+_XML_ESCAPE_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#x27;",
+    },
+)
+
+# Characters that are not allowed anywhere in an XML document. Escaping does not
+# touch them, so a value containing one can still break well-formedness.
+_XML_ILLEGAL_CHARS_RE = re.compile(
+    r"[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]"
+)
+
+# Supported template formats
+_FORMATS = frozenset({"Markdown", "Storage"})
+
+# Root element declaring the Confluence Storage Format namespace prefixes
+# (ac:, ri:). Without lxml it is fed to the parser around the rendered output
+# rather than concatenated with it (see _parse_xml).
+_NS_ROOT_OPEN = (
+    '<root xmlns:ac="http://atlassian.com/content" '
+    'xmlns:ri="http://atlassian.com/rich">'
+)
+_NS_ROOT_CLOSE = "</root>"
+
+# Parse errors raised by whichever XML parser _parse_xml uses
+_XML_PARSE_ERRORS: tuple[type[Exception], ...] = (
+    (ET.ParseError,) if _LET is None else (ET.ParseError, _LET.XMLSyntaxError)
+)
+
+# Per-thread lxml parser reused across validations (lxml parsers must not be
+# shared between threads)
+_parser_tls = threading.local()
+
+# Inside a CDATA section entities are not decoded, so values are written raw.
+# The only sequence that must not appear is the section terminator; it is
+# split across two adjacent CDATA sections instead.
+_CDATA_END = "]]>"
+_CDATA_END_SPLIT = "]]]]><![CDATA[>"
+
+# Sentinel distinguishing a missing variable from one whose value is None
+_MISSING = object()
+
 
 class TemplateEngineError(Exception):
     """Base exception for template engine errors."""
@@ -54,72 +109,156 @@ class TemplateEngine:
             TemplateEngineError: If rendering fails
             TemplateValidationError: If Storage Format output is invalid XML
         """
-        if format not in ("Markdown", "Storage"):
+        if format not in _FORMATS:
             raise TemplateEngineError(
                 f"Invalid template format: {format}. Must be 'Markdown' or 'Storage'"
             )
 
-        # Perform placeholder substitution
-        rendered = cls._substitute_placeholders(template_body, variables, format)
+        # Markdown is plain text: values are substituted as-is
+        if format == "Markdown":
+            return cls._substitute_markdown(template_body, variables)
 
-        # Validate Storage Format output
-        if format == "Storage":
+        # Perform placeholder substitution
+        rendered = cls._substitute_storage(template_body, variables)
+
+        # Validate Storage Format output. Substituted values are escaped (or,
+        # inside CDATA, have "]]>" split) and cannot introduce markup, so the
+        # rendered output is well-formed whenever the template is; that check
+        # is cached across renders.
+        # Comments ("--" is not escaped) and XML-illegal characters still need
+        # a full parse of the rendered output.
+        if "<!--" in template_body or _XML_ILLEGAL_CHARS_RE.search(rendered):
             cls._validate_storage_format(rendered)
+        else:
+            try:
+                cls._validate_storage_template(template_body)
+            except TemplateValidationError:
+                # Placeholders can complete markup ("<{{tag}}>", "&{{e}};"),
+                # so the rendered output decides
+                cls._validate_storage_format(rendered)
 
         return rendered
 
     @classmethod
-    def _substitute_placeholders(
-        cls,
-        template_body: str,
-        variables: dict[str, Any],
-        format: str,  # noqa: A002
-    ) -> str:
-        """Substitute placeholders in template body with variable values.
+    def _substitute_markdown(cls, template_body: str, variables: dict[str, Any]) -> str:
+        """Substitute placeholders in a Markdown template body.
+
+        Each format has its own substitution loop, chosen once per render, so
+        the per-placeholder work never branches on the format.
 
         Args:
             template_body: Template body with {{variable}} placeholders
             variables: Dictionary of variable values
-            format: Template format for escaping
 
         Returns:
             Template with placeholders replaced
         """
+        # split() slices the body in C into [text, name, text, name, ..., text]
+        # without a Match object or a Python callback per placeholder; the
+        # names are then replaced in place and the list joined once.
+        parts = cls.PLACEHOLDER_PATTERN.split(template_body)
+        if len(parts) == 1:
+            return template_body
+
+        get = variables.get
+        for i in range(1, len(parts), 2):
+            value = get(parts[i], _MISSING)
+            if value is _MISSING:
+                parts[i] = cls._missing_placeholder(parts[i])
+            else:
+                parts[i] = str(value)
+
+        return "".join(parts)
 
-        def replace_placeholder(match: re.Match[str]) -> str:
-            var_name = match.group(1)
-            if var_name not in variables:
-                logger.warning(
-                    f"Placeholder '{{{{{var_name}}}}}' not found in variables, leaving as-is",
-                    extra={"variable": var_name},
-                )
-                return match.group(0)  # Return original placeholder
+    @classmethod
+    def _substitute_storage(cls, template_body: str, variables: dict[str, Any]) -> str:
+        """Substitute placeholders in a Storage Format template body.
 
-            value = str(variables[var_name])
+        Values are XML-escaped, except inside CDATA sections, where only the
+        section terminator is split.
 
-            # Escape based on format
-            if format == "Storage":
-                # For Storage Format, escape XML/HTML characters
-                return cls._escape_storage_format(value)
-            # For Markdown, treat as plain text (no escaping needed for basic substitution)
-            return value
+        Args:
+            template_body: Template body with {{variable}} placeholders
+            variables: Dictionary of variable values
 
-        return cls.PLACEHOLDER_PATTERN.sub(replace_placeholder, template_body)
+        Returns:
+            Template with placeholders replaced
+        """
+        parts = cls.PLACEHOLDER_PATTERN.split(template_body)
+        if len(parts) == 1:
+            return template_body
+
+        in_cdata = cls._cdata_placeholders(template_body)
+        get = variables.get
+        for i in range(1, len(parts), 2):
+            value = get(parts[i], _MISSING)
+            if value is _MISSING:
+                parts[i] = cls._missing_placeholder(parts[i])
+            elif i in in_cdata:
+                parts[i] = str(value).replace(_CDATA_END, _CDATA_END_SPLIT)
+            else:
+                # Escape <, >, &, ", ' in one pass to prevent script
+                # injection (NFR-10)
+                parts[i] = str(value).translate(_XML_ESCAPE_TABLE)
+
+        return "".join(parts)
+
+    @staticmethod
+    def _missing_placeholder(var_name: str) -> str:
+        """Log a placeholder with no matching variable and return its original text."""
+        logger.warning(
+            f"Placeholder '{{{{{var_name}}}}}' not found in variables, leaving as-is",
+            extra={"variable": var_name},
+        )
+        return f"{{{{{var_name}}}}}"  # Keep original placeholder
 
     @classmethod
-    def _escape_storage_format(cls, value: str) -> str:
-        """Escape a value for safe inclusion in Confluence Storage Format XML.
-
-        Escapes XML/HTML special characters to prevent script injection (NFR-10).
+    @lru_cache(maxsize=256)
+    def _cdata_placeholders(cls, template_body: str) -> frozenset[int]:
+        """Find the placeholders that sit inside CDATA sections of a template.
 
         Args:
-            value: Value to escape
+            template_body: Template body with {{variable}} placeholders
 
         Returns:
-            Escaped value safe for XML/HTML
+            Indexes, in PLACEHOLDER_PATTERN.split(template_body), of the
+            placeholder names inside <![CDATA[...]]> sections
+        """
+        if "<![CDATA[" not in template_body:
+            return frozenset()
+
+        sections: list[tuple[int, int]] = []
+        find = template_body.find
+        pos = 0
+        while (start := find("<![CDATA[", pos)) != -1:
+            end = find(_CDATA_END, start)
+            if end == -1:
+                # Unterminated section; validation will reject the template
+                end = len(template_body)
+            sections.append((start, end))
+            pos = end + len(_CDATA_END)
+
+        # The n-th placeholder's name is element 2n+1 of the split() result
+        return frozenset(
+            2 * n + 1
+            for n, match in enumerate(cls.PLACEHOLDER_PATTERN.finditer(template_body))
+            if any(start <= match.start() < end for start, end in sections)
+        )
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _validate_storage_template(cls, template_body: str) -> None:
+        """Validate a Storage Format template body, caching successful checks.
+
+        Failures raise and are therefore never cached.
+
+        Args:
+            template_body: Template body with {{variable}} placeholders
+
+        Raises:
+            TemplateValidationError: If the template is not well-formed XML
         """
-        # Use HTML escaping which handles: <, >, &, ", '
-        return html_escape(value)
+        cls._validate_storage_format(template_body)
 
     @classmethod
     def _validate_storage_format(cls, rendered: str) -> None:
@@ -139,17 +278,12 @@ class TemplateEngine:
             # Confluence Storage Format uses namespaces (ac:, ri:, etc.)
             # We need to handle namespace prefixes. Try wrapping in a root element
             # with namespace declarations for validation
-            wrapped_xml = (
-                '<root xmlns:ac="http://atlassian.com/content" '
-                'xmlns:ri="http://atlassian.com/rich">'
-                f"{rendered}</root>"
-            )
-            ET.fromstring(wrapped_xml)
-        except ET.ParseError as e:
+            cls._parse_xml(_NS_ROOT_OPEN, rendered, _NS_ROOT_CLOSE)
+        except _XML_PARSE_ERRORS as e:
             # If wrapping fails, try parsing directly (might work for simple XML)
             try:
-                ET.fromstring(rendered)
-            except ET.ParseError:
+                cls._parse_xml(rendered)
+            except _XML_PARSE_ERRORS:
                 # Provide a friendly error message
                 error_msg = (
                     f"Invalid Confluence Storage Format XML: {e!s}. "
@@ -164,3 +298,43 @@ class TemplateEngine:
                 "Please check your template syntax."
             )
             raise TemplateValidationError(error_msg) from e
+
+    @classmethod
+    def _parse_xml(cls, *chunks: str) -> None:
+        """Check that the concatenation of chunks is well-formed XML.
+
+        Without lxml, the chunks are fed to an xml.etree.ElementTree
+        incremental parser in order, so they are never joined into one
+        string. lxml's libxml2 parser (strict: no error recovery, no entity
+        resolution) is used when installed; its feed interface can report the
+        wrong error for a document split into chunks (an undefined entity
+        comes back as "invalid element name"), so under lxml the document is
+        joined and parsed in one call.
+
+        Args:
+            chunks: Consecutive pieces of one XML document
+
+        Raises:
+            ET.ParseError or lxml.etree.XMLSyntaxError: If xml is not well-formed
+        """
+        if _LET is not None:
+            _LET.fromstring("".join(chunks), cls._get_parser())
+            return
+
+        parser = ET.XMLParser()
+        for chunk in chunks:
+            parser.feed(chunk)
+        parser.close()
+
+    @staticmethod
+    def _get_parser() -> Any:
+        """Return this thread's strict lxml parser, creating it on first use.
+
+        lxml resets a parser for each document it parses, so one instance per
+        thread can validate any number of documents.
+        """
+        parser = getattr(_parser_tls, "parser", None)
+        if parser is None:
+            parser = _LET.XMLParser(recover=False, resolve_entities=False)
+            _parser_tls.parser = parser
+        return parser
@@ -2,23 +2,81 @@
 TypeScript AST Parser Service
 
 This module provides a Python interface to the Node.js TypeScript parser.
-It executes the Node.js parser via subprocess and parses the JSON AST output.
+It runs the Node.js parser as a long-lived worker process and parses the JSON
+AST output, so Node.js starts once per parser rather than once per file.
 
 Usage:
-    parser = TypeScriptParser()
-    ast = parser.parse_file('path/to/file.ts')
-    # Or parse from string
-    ast = parser.parse_string(typescript_code)
+    with TypeScriptParser() as parser:
+        ast = parser.parse_file('path/to/file.ts')
+        # Or parse from string
+        ast = parser.parse_string(typescript_code)
 """
 
+import contextlib
+import hashlib
 import json
 import logging
+import os
+import queue
 import subprocess
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, ClassVar, NoReturn
+
+try:
+    import orjson
+except ImportError:
+    # orjson not installed, use the json module instead
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for the parser's reply to one request
+_PARSE_TIMEOUT = 30
+
+# Files parse_stream takes ahead of the AST it is yielding
+_STREAM_WINDOW = 16
+
+# extract_public_symbols bucket for each kind of top-level declaration
+_SYMBOL_BUCKETS = {
+    "ClassDeclaration": "classes",
+    "FunctionDeclaration": "functions",
+    "TSInterfaceDeclaration": "interfaces",
+    "TSTypeAliasDeclaration": "types",
+    "TSEnumDeclaration": "enums",
+}
+
+# Export type reported for each kind of exported declaration
+_EXPORT_TYPES = {
+    "ClassDeclaration": "class",
+    "FunctionDeclaration": "function",
+    "TSInterfaceDeclaration": "interface",
+    "TSTypeAliasDeclaration": "type",
+    "TSEnumDeclaration": "enum",
+    "VariableDeclaration": "variable",
+}
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Decode JSON, with orjson when it is installed.
+
+    Invalid input raises ValueError (json.JSONDecodeError, which
+    orjson.JSONDecodeError subclasses, or UnicodeDecodeError from bytes).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode obj as UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
 
 class TypeScriptParserError(Exception):
     """Base exception for TypeScript parser errors."""
@@ -36,17 +94,30 @@ class TypeScriptParser:
     """
     Python wrapper for TypeScript AST parser using Node.js bridge.
 
-    This class executes the Node.js parser script and converts the JSON
-    output into Python data structures.
+    This class runs the Node.js parser script as a worker process, started
+    on the first parse and reused for every later one, and converts the JSON
+    output into Python data structures. Call close() (or use the parser as a
+    context manager) to stop the worker.
     """
 
-    def __init__(self, parser_script: str | None = None) -> None:
+    # Set once Node.js has been found, so later parsers skip the check
+    _nodejs_verified: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        parser_script: str | None = None,
+        ast_cache_dir: Path | None = None,
+    ) -> None:
         """
         Initialize the TypeScript parser.
 
         Args:
             parser_script: Path to the Node.js parser script.
                           Defaults to 'scripts/parse-typescript.js'
+            ast_cache_dir: Optional directory for caching the ASTs of parsed
+                          files on disk. Files that have not changed since
+                          they were cached are then not re-parsed, across
+                          parser instances and runs.
         """
         if parser_script is None:
             # Assume we're running from project root
@@ -57,14 +128,25 @@ class TypeScriptParser:
             script_path = Path(parser_script)
 
         self.parser_script = script_path
+        self.ast_cache_dir = ast_cache_dir
 
         if not self.parser_script.exists():
             raise FileNotFoundError(
                 f"Parser script not found: {self.parser_script}",
             )
 
-        # Verify Node.js is available
-        self._check_nodejs()
+        # Verify Node.js is available (once per process; a failed check is
+        # not remembered, so it is retried by the next parser)
+        if not TypeScriptParser._nodejs_verified:
+            self._check_nodejs()
+            TypeScriptParser._nodejs_verified = True
+
+        # Long-lived Node.js process serving parse requests, started on
+        # first use
+        self._worker: subprocess.Popen[bytes] | None = None
+        self._worker_output: queue.Queue[bytes | None] | None = None
+        self._worker_stderr: IO[bytes] | None = None
+        self._worker_lock = threading.Lock()
 
     def _check_nodejs(self) -> None:
         """Check if Node.js is installed and available."""
@@ -89,6 +171,33 @@ class TypeScriptParser:
         except subprocess.TimeoutExpired:
             raise NodeJSNotFoundError("Node.js version check timed out") from None
 
+    def __enter__(self) -> "TypeScriptParser":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Best effort: interpreter shutdown may already have torn down modules
+        with contextlib.suppress(Exception):
+            self.close()
+
+    def close(self) -> None:
+        """Stop the Node.js parser worker, if one is running."""
+        worker, self._worker = self._worker, None
+        stderr, self._worker_stderr = self._worker_stderr, None
+        self._worker_output = None
+        if worker is not None:
+            try:
+                # Closing stdin ends the worker's read loop
+                worker.stdin.close()  # type: ignore[union-attr]
+                worker.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                worker.kill()
+                worker.wait()
+        if stderr is not None:
+            stderr.close()
+
     def parse_file(self, file_path: str | Path) -> dict[str, Any]:
         """
         Parse a TypeScript file and return its AST.
@@ -108,44 +217,22 @@ class TypeScriptParser:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        logger.info(f"Parsing TypeScript file: {file_path}")
+        cache_file = self._ast_cache_file(file_path)
+        if cache_file is not None:
+            ast = self._read_cached_ast(cache_file)
+            if ast is not None:
+                logger.info(f"Using cached AST for TypeScript file: {file_path}")
+                return ast
 
-        try:
-            result = subprocess.run(
-                ["node", str(self.parser_script), str(file_path)],
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=30,  # 30 second timeout
-            )
-
-            if result.returncode != 0:
-                # Try to parse error from stderr
-                error_data = self._parse_error_output(result.stderr)
-                raise ParseError(
-                    f"Parsing failed: {error_data.get('message', 'Unknown error')}",
-                )
-
-            # Parse JSON output
-            ast_data = json.loads(result.stdout)
+        logger.info(f"Parsing TypeScript file: {file_path}")
 
-            if not ast_data.get("success"):
-                error_info = ast_data.get("error", {})
-                raise ParseError(
-                    f"Parse error: {error_info.get('message', 'Unknown error')}",
-                )
+        ast = self._parse({"filePath": str(file_path)})
 
-            logger.info("Successfully parsed TypeScript file")
-            return ast_data["ast"]
+        if cache_file is not None:
+            self._write_cached_ast(cache_file, ast)
 
-        except subprocess.TimeoutExpired:
-            raise ParseError("Parser timed out after 30 seconds") from None
-        except json.JSONDecodeError as e:
-            raise ParseError(f"Failed to parse JSON output: {e}") from e
-        except FileNotFoundError:
-            raise FileNotFoundError(
-                f"Parser script not found: {self.parser_script}",
-            ) from None
+        logger.info("Successfully parsed TypeScript file")
+        return ast
 
     def parse_string(self, source_code: str) -> dict[str, Any]:
         """
@@ -165,38 +252,391 @@ class TypeScriptParser:
 
         logger.info("Parsing TypeScript source code from string")
 
+        ast = self._parse({"sourceCode": source_code})
+
+        logger.info("Successfully parsed TypeScript source code")
+        return ast
+
+    def parse_files(self, file_paths: list[str | Path]) -> list[dict[str, Any]]:
+        """
+        Parse several TypeScript files and return their ASTs.
+
+        Every request is written to the worker before any reply is read, so
+        Node.js parses the files back to back instead of waiting for a round
+        trip per file. Files found in the AST cache are not sent at all.
+
+        Args:
+            file_paths: Paths to the TypeScript files to parse
+
+        Returns:
+            One AST dictionary per path, in order
+
+        Raises:
+            ParseError: If parsing any of the files fails
+            FileNotFoundError: If a file doesn't exist
+        """
+        paths = [Path(file_path) for file_path in file_paths]
+
+        for file_path in paths:
+            if not file_path.exists():
+                raise FileNotFoundError(f"File not found: {file_path}")
+
+        cache_files = [self._ast_cache_file(file_path) for file_path in paths]
+        asts: list[dict[str, Any] | None] = [
+            None if cache_file is None else self._read_cached_ast(cache_file)
+            for cache_file in cache_files
+        ]
+        misses = [i for i, ast in enumerate(asts) if ast is None]
+
+        logger.info(
+            f"Parsing {len(misses)} of {len(paths)} TypeScript files "
+            "(the rest are cached)",
+        )
+
+        if misses:
+            with self._worker_lock:
+                replies = self._worker_requests(
+                    [{"filePath": str(paths[i])} for i in misses],
+                )
+
+            for i, reply in zip(misses, replies, strict=True):
+                try:
+                    ast = self._decode_reply(reply)
+                except ParseError as e:
+                    raise ParseError(f"{paths[i]}: {e}") from e
+                cache_file = cache_files[i]
+                if cache_file is not None:
+                    self._write_cached_ast(cache_file, ast)
+                asts[i] = ast
+
+        logger.info("Successfully parsed TypeScript files")
+        return asts  # type: ignore[return-value]
+
+    def parse_stream(
+        self,
+        file_paths: Iterable[str | Path],
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Parse TypeScript files lazily, yielding each AST in order.
+
+        Up to _STREAM_WINDOW files are read ahead of the caller, so Node.js
+        parses the next files while earlier ASTs are being processed, and
+        paths are taken from file_paths only as the window has room. Files
+        found in the AST cache are not sent to the worker.
+
+        Each stream runs on a Node.js worker of its own, started with the
+        first file that is not cached, so the parser stays free for other
+        parses (from this thread or others) while the stream is suspended.
+        The stream's worker is stopped when the iteration finishes or the
+        generator is closed, discarding replies still in flight.
+
+        Args:
+            file_paths: Paths to the TypeScript files to parse
+
+        Yields:
+            One AST dictionary per path, in order
+
+        Raises:
+            ParseError: If parsing a file fails
+            FileNotFoundError: If a file doesn't exist
+        """
+        paths = iter(file_paths)
+        # (path, cache entry, AST if cached) in yield order
+        pending: deque[tuple[Path, Path | None, dict[str, Any] | None]] = deque()
+
+        # The stream's own worker: nothing of this parser is held while the
+        # caller has the stream suspended
+        with TypeScriptParser(str(self.parser_script)) as stream_worker:
+            while True:
+                while len(pending) < _STREAM_WINDOW:
+                    next_path = next(paths, None)
+                    if next_path is None:
+                        break
+                    file_path = Path(next_path)
+                    if not file_path.exists():
+                        raise FileNotFoundError(f"File not found: {file_path}")
+                    cache_file = self._ast_cache_file(file_path)
+                    ast = (
+                        None
+                        if cache_file is None
+                        else self._read_cached_ast(cache_file)
+                    )
+                    if ast is None:
+                        stream_worker._write_worker_requests(
+                            [{"filePath": str(file_path)}],
+                        )
+                    pending.append((file_path, cache_file, ast))
+
+                if not pending:
+                    return
+
+                file_path, cache_file, ast = pending.popleft()
+                if ast is None:
+                    reply = stream_worker._read_worker_reply()
+                    try:
+                        ast = self._decode_reply(reply)
+                    except ParseError as e:
+                        raise ParseError(f"{file_path}: {e}") from e
+                    if cache_file is not None:
+                        self._write_cached_ast(cache_file, ast)
+
+                yield ast
+
+    def _ast_cache_file(self, file_path: Path) -> Path | None:
+        """
+        Return the AST cache entry for a file, or None if caching is off.
+
+        Entries are keyed by a SHA-256 digest of the parser script and the
+        file's path, modification time, size and inode, so a file that is
+        edited or replaced misses the cache without being read.
+
+        Args:
+            file_path: Path to the TypeScript file
+
+        Returns:
+            Path of the cache entry (which may not exist yet)
+        """
+        if self.ast_cache_dir is None:
+            return None
+
+        st = file_path.stat()
+        digest = hashlib.sha256(
+            f"{self.parser_script.resolve()}\0{file_path.resolve()}\0"
+            f"{st.st_mtime_ns}\0{st.st_size}\0{st.st_ino}".encode(
+                "utf-8", "surrogatepass"
+            )
+        ).hexdigest()
+        return self.ast_cache_dir / f"{digest}.json"
+
+    def _read_cached_ast(self, cache_file: Path) -> dict[str, Any] | None:
+        """
+        Return a cached AST, or None on a miss.
+
+        Unreadable cache entries are treated as misses.
+        """
         try:
-            result = subprocess.run(
-                ["node", str(self.parser_script)],
-                check=False,
-                input=source_code,
-                capture_output=True,
-                text=True,
-                timeout=30,
+            return _json_loads(cache_file.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning(
+                "Ignoring unreadable AST cache entry",
+                extra={"cache_file": str(cache_file)},
             )
+            return None
 
-            if result.returncode != 0:
-                error_data = self._parse_error_output(result.stderr)
-                raise ParseError(
-                    f"Parsing failed: {error_data.get('message', 'Unknown error')}",
-                )
+    def _write_cached_ast(self, cache_file: Path, ast: dict[str, Any]) -> None:
+        """
+        Store an AST in the cache.
 
-            ast_data = json.loads(result.stdout)
+        Failures to write the entry are logged, never raised.
+        """
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename it into place, so a
+            # concurrent reader never sees a partial entry
+            fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            tmp_file = Path(tmp_name)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_json_dumps(ast))
+                tmp_file.replace(cache_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.warning(
+                "Failed to write AST cache entry",
+                extra={"cache_file": str(cache_file)},
+            )
 
-            if not ast_data.get("success"):
-                error_info = ast_data.get("error", {})
-                raise ParseError(
-                    f"Parse error: {error_info.get('message', 'Unknown error')}",
-                )
+    def _parse(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Send a parse request to the Node.js worker and return the AST.
 
-            logger.info("Successfully parsed TypeScript source code")
-            return ast_data["ast"]
+        Args:
+            request: Parse request ({"filePath": ...} or {"sourceCode": ...})
 
-        except subprocess.TimeoutExpired:
-            raise ParseError("Parser timed out after 30 seconds") from None
-        except json.JSONDecodeError as e:
+        Returns:
+            Dictionary containing the AST and metadata
+
+        Raises:
+            ParseError: If parsing fails
+        """
+        with self._worker_lock:
+            reply = self._worker_request(request)
+
+        return self._decode_reply(reply)
+
+    def _decode_reply(self, reply: bytes) -> dict[str, Any]:
+        """
+        Decode one worker reply and return its AST.
+
+        Args:
+            reply: The worker's JSON reply line
+
+        Returns:
+            Dictionary containing the AST and metadata
+
+        Raises:
+            ParseError: If the reply is not JSON or reports a parse failure
+        """
+        try:
+            ast_data = _json_loads(reply)
+        except ValueError as e:
+            # JSONDecodeError, or UnicodeDecodeError from json.loads
             raise ParseError(f"Failed to parse JSON output: {e}") from e
 
+        if not ast_data.get("success"):
+            error_info = ast_data.get("error", {})
+            raise ParseError(
+                f"Parse error: {error_info.get('message', 'Unknown error')}",
+            )
+
+        return ast_data["ast"]
+
+    def _worker_request(self, request: dict[str, Any]) -> bytes:
+        """
+        Send one request to the Node.js worker and wait for its reply line.
+
+        Args:
+            request: Parse request to send
+
+        Returns:
+            The worker's JSON reply
+
+        Raises:
+            ParseError: If the worker times out or exits
+        """
+        return self._worker_requests([request])[0]
+
+    def _worker_requests(self, requests: list[dict[str, Any]]) -> list[bytes]:
+        """
+        Send requests to the Node.js worker and wait for all of their replies.
+
+        The requests go out in one write, and every reply is read before
+        returning, so a failed request never leaves replies behind for the
+        next call.
+
+        Args:
+            requests: Parse requests to send
+
+        Returns:
+            The worker's JSON replies, in request order
+
+        Raises:
+            ParseError: If the worker times out or exits
+        """
+        self._write_worker_requests(requests)
+        return [self._read_worker_reply() for _ in requests]
+
+    def _write_worker_requests(self, requests: list[dict[str, Any]]) -> None:
+        """
+        Write requests to the Node.js worker in one write.
+
+        The worker is started on first use. If it has exited, it is stopped
+        and the next request starts a fresh one.
+
+        Raises:
+            ParseError: If the worker has exited
+        """
+        if self._worker is None or self._worker_output is None:
+            worker, _ = self._start_worker()
+        else:
+            worker = self._worker
+
+        try:
+            worker.stdin.write(  # type: ignore[union-attr]
+                "".join(json.dumps(request) + "\n" for request in requests).encode(),
+            )
+            worker.stdin.flush()  # type: ignore[union-attr]
+        except OSError:
+            # The worker exited before reading the requests
+            self._raise_worker_exited()
+
+    def _read_worker_reply(self) -> bytes:
+        """
+        Wait for the Node.js worker's next reply line.
+
+        If the worker times out or exits, it is stopped and the next request
+        starts a fresh one.
+
+        Raises:
+            ParseError: If the worker times out or exits
+        """
+        try:
+            line = self._worker_output.get(  # type: ignore[union-attr]
+                timeout=_PARSE_TIMEOUT,
+            )
+        except queue.Empty:
+            self.close()
+            raise ParseError(
+                f"Parser timed out after {_PARSE_TIMEOUT} seconds",
+            ) from None
+
+        if line is None:
+            self._raise_worker_exited()
+
+        return line
+
+    def _raise_worker_exited(self) -> NoReturn:
+        """Stop the exited worker and raise a ParseError with its stderr."""
+        error_data = self._parse_error_output(self._read_worker_stderr())
+        self.close()
+        raise ParseError(
+            f"Parsing failed: {error_data.get('message', 'Unknown error')}",
+        )
+
+    def _start_worker(
+        self,
+    ) -> tuple[subprocess.Popen[bytes], queue.Queue[bytes | None]]:
+        """Start the Node.js worker and a thread that queues its reply lines.
+
+        The worker's pipes are binary: replies stay UTF-8 bytes, which the
+        JSON decoders read directly, so large ASTs are not first decoded into
+        a str.
+        """
+        # Lives as long as the worker; closed in close()
+        stderr = tempfile.TemporaryFile()  # noqa: SIM115
+        try:
+            worker = subprocess.Popen(
+                ["node", str(self.parser_script), "--server"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+            )
+        except BaseException:
+            stderr.close()
+            raise
+
+        output: queue.Queue[bytes | None] = queue.Queue()
+
+        def read_output() -> None:
+            # None marks the end of output (the worker exited)
+            for line in worker.stdout:  # type: ignore[union-attr]
+                output.put(line)
+            output.put(None)
+
+        threading.Thread(
+            target=read_output, name="typescript-parser-worker", daemon=True
+        ).start()
+        self._worker = worker
+        self._worker_output = output
+        self._worker_stderr = stderr
+        return worker, output
+
+    def _read_worker_stderr(self) -> str:
+        """Return what the worker wrote to stderr, once it has exited."""
+        if self._worker is None or self._worker_stderr is None:
+            return ""
+        try:
+            self._worker.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._worker.kill()
+            self._worker.wait()
+        self._worker_stderr.seek(0)
+        return self._worker_stderr.read().decode("utf-8", "replace")
+
     def _parse_error_output(self, stderr: str) -> dict[str, Any]:
         """
         Try to parse error output from stderr as JSON.
@@ -226,66 +666,37 @@ class TypeScriptParser:
             Dictionary with extracted symbols by type
         """
         symbols: dict[str, list[dict[str, Any]]] = {
-            "classes": [],
-            "functions": [],
-            "interfaces": [],
-            "types": [],
-            "enums": [],
+            bucket: [] for bucket in _SYMBOL_BUCKETS.values()
         }
 
-        if "body" not in ast:
+        body = ast.get("body")
+        if not isinstance(body, list):
             return symbols
 
-        for node in ast["body"]:
+        for node in body:
             if not isinstance(node, dict):
                 continue
 
-            if node.get("type") == "ClassDeclaration":
-                if node.get("id", {}).get("name"):
-                    symbols["classes"].append(
-                        {
-                            "name": node["id"]["name"],
-                            "line": node.get("loc", {}).get("start", {}).get("line"),
-                            "decorators": len(node.get("decorators", [])),
-                        },
-                    )
-
-            elif node.get("type") == "FunctionDeclaration":
-                if node.get("id", {}).get("name"):
-                    symbols["functions"].append(
-                        {
-                            "name": node["id"]["name"],
-                            "line": node.get("loc", {}).get("start", {}).get("line"),
-                            "async": node.get("async", False),
-                        },
-                    )
-
-            elif node.get("type") == "TSInterfaceDeclaration":
-                if node.get("id", {}).get("name"):
-                    symbols["interfaces"].append(
-                        {
-                            "name": node["id"]["name"],
-                            "line": node.get("loc", {}).get("start", {}).get("line"),
-                        },
-                    )
+            node_type = node.get("type")
+            if not isinstance(node_type, str):
+                continue
+            bucket = _SYMBOL_BUCKETS.get(node_type)
+            if bucket is None:
+                continue
 
-            elif node.get("type") == "TSTypeAliasDeclaration":
-                if node.get("id", {}).get("name"):
-                    symbols["types"].append(
-                        {
-                            "name": node["id"]["name"],
-                            "line": node.get("loc", {}).get("start", {}).get("line"),
-                        },
-                    )
+            name = node.get("id", {}).get("name")
+            if not name:
+                continue
 
-            elif node.get("type") == "TSEnumDeclaration":
-                if node.get("id", {}).get("name"):
-                    symbols["enums"].append(
-                        {
-                            "name": node["id"]["name"],
-                            "line": node.get("loc", {}).get("start", {}).get("line"),
-                        },
-                    )
+            symbol = {
+                "name": name,
+                "line": node.get("loc", {}).get("start", {}).get("line"),
+            }
+            if bucket == "classes":
+                symbol["decorators"] = len(node.get("decorators", []))
+            elif bucket == "functions":
+                symbol["async"] = node.get("async", False)
+            symbols[bucket].append(symbol)
 
         return symbols
 
@@ -318,36 +729,44 @@ class TypeScriptParser:
         namespace_stack: list[str],
         exports: list[dict[str, Any]],
     ) -> None:
-        for node in nodes:
-            node_type = node.get("type")
-
-            if node_type in {"ExportNamedDeclaration", "ExportDefaultDeclaration"}:
-                self._handle_export_declaration(
-                    node,
-                    namespace_stack=namespace_stack,
-                    exports=exports,
-                )
-            elif node_type == "ExportAllDeclaration":
-                self._handle_export_all_declaration(
-                    node,
-                    namespace_stack=namespace_stack,
-                    exports=exports,
-                )
-            elif node_type == "TSModuleDeclaration":
-                module_name = node.get("id", {}).get("name")
-                body = node.get("body", {})
-                if (
-                    isinstance(module_name, str)
-                    and isinstance(body, dict)
-                    and body.get("type") == "TSModuleBlock"
-                ):
-                    nested_nodes = body.get("body", [])
-                    if isinstance(nested_nodes, list):
-                        self._extract_exports_from_nodes(
-                            nested_nodes,
-                            namespace_stack=[*namespace_stack, module_name],
-                            exports=exports,
-                        )
+        # Walk nested namespaces depth-first with an explicit stack of
+        # (remaining sibling nodes, namespace path), so exports keep source
+        # order and deep nesting cannot hit the recursion limit
+        stack = [(iter(nodes), namespace_stack)]
+        while stack:
+            remaining, namespace = stack[-1]
+            for node in remaining:
+                node_type = node.get("type")
+
+                if node_type in {"ExportNamedDeclaration", "ExportDefaultDeclaration"}:
+                    self._handle_export_declaration(
+                        node,
+                        namespace_stack=namespace,
+                        exports=exports,
+                    )
+                elif node_type == "ExportAllDeclaration":
+                    self._handle_export_all_declaration(
+                        node,
+                        namespace_stack=namespace,
+                        exports=exports,
+                    )
+                elif node_type == "TSModuleDeclaration":
+                    module_name = node.get("id", {}).get("name")
+                    body = node.get("body", {})
+                    if (
+                        isinstance(module_name, str)
+                        and isinstance(body, dict)
+                        and body.get("type") == "TSModuleBlock"
+                    ):
+                        nested_nodes = body.get("body", [])
+                        if isinstance(nested_nodes, list):
+                            # Finish the namespace before this node's siblings
+                            stack.append(
+                                (iter(nested_nodes), [*namespace, module_name]),
+                            )
+                            break
+            else:
+                stack.pop()
 
     def _handle_export_declaration(
         self,
@@ -440,17 +859,8 @@ class TypeScriptParser:
             else:
                 return None
 
-        export_type_map = {
-            "ClassDeclaration": "class",
-            "FunctionDeclaration": "function",
-            "TSInterfaceDeclaration": "interface",
-            "TSTypeAliasDeclaration": "type",
-            "TSEnumDeclaration": "enum",
-            "VariableDeclaration": "variable",
-        }
-
         export_type = (
-            export_type_map.get(decl_type, "unknown")
+            _EXPORT_TYPES.get(decl_type, "unknown")
             if isinstance(decl_type, str)
             else "unknown"
         )
@@ -1,10 +1,12 @@
 """Pytest configuration and shared fixtures."""
 
+import contextlib
+import subprocess
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock
 
 import pytest
 
@@ -149,14 +151,116 @@ def mock_file_system() -> Mock:
     return fs
 
 
-@pytest.fixture
-def mock_nodejs():
-    """Mock Node.js availability for TypeScript parser tests."""
-    with patch("services.typescript_parser.subprocess.run") as mock_run:
-        mock_run.return_value = Mock(returncode=0, stdout="v18.0.0\n")
+@pytest.fixture(scope="session")
+def sample_ts_files(tmp_path_factory) -> Path:
+    """Directory of sample TypeScript files, written once per session.
+
+    Contains class.ts (valid source) and invalid.ts (a syntax error). Tests
+    only read them.
+    """
+    directory = tmp_path_factory.mktemp("ts")
+    (directory / "class.ts").write_text("export class MyClass {}")
+    (directory / "invalid.ts").write_text("invalid syntax here")
+    return directory
+
+
+# Canned results for the Node.js commands the TypeScript parser runs through
+# subprocess.run, keyed by argv
+_NODE_RESPONSES = {
+    ("node", "--version"): subprocess.CompletedProcess(
+        args=["node", "--version"], returncode=0, stdout="v18.0.0\n", stderr=""
+    ),
+}
+
+
+def _dispatch_node_command(argv, **kwargs):
+    """subprocess.run side effect answering commands from _NODE_RESPONSES."""
+    return _NODE_RESPONSES.get(tuple(argv), DEFAULT)
+
+
+@contextlib.contextmanager
+def _mocked_node() -> Generator[Mock, None, None]:
+    """Replace subprocess.run with a Mock answering from _NODE_RESPONSES.
+
+    The parser's once-per-process Node.js check is reset while the mock is in
+    place, and both are restored on exit.
+    """
+    from services.typescript_parser import TypeScriptParser
+
+    mock_run = Mock(side_effect=_dispatch_node_command)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(TypeScriptParser, "_nodejs_verified", False)
+        mp.setattr("services.typescript_parser.subprocess.run", mock_run)
         yield mock_run
 
 
+@pytest.fixture(scope="module")
+def _node_subprocess_run() -> Generator[Mock, None, None]:
+    """subprocess.run as seen by the TypeScript parser, mocked once per module.
+
+    This swaps subprocess.run itself, so the mock only lives as long as the
+    test module that asked for it; mock_nodejs re-arms it for each test.
+    """
+    with _mocked_node() as mock_run:
+        yield mock_run
+
+
+@pytest.fixture
+def mock_nodejs(_node_subprocess_run: Mock) -> Mock:
+    """Mock Node.js availability for TypeScript parser tests.
+
+    The parser's once-per-process Node.js check is reset for the test, so
+    constructors run it against this mock.
+
+    Commands listed in _NODE_RESPONSES always get their canned result; any
+    other command gets the mock's return_value, which tests set.
+    Assigning side_effect replaces the dispatch for the whole test.
+    """
+    from services.typescript_parser import TypeScriptParser
+
+    TypeScriptParser._nodejs_verified = False
+    mock_run = _node_subprocess_run
+    mock_run.reset_mock(return_value=True, side_effect=True)
+    mock_run.side_effect = _dispatch_node_command
+    mock_run.return_value = _NODE_RESPONSES[("node", "--version")]
+    return mock_run
+
+
+@pytest.fixture
+def mock_parser_worker(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Mock the TypeScript parser's Node.js worker.
+
+    Replaces TypeScriptParser._worker_request, which is called with each
+    parse request and returns the worker's JSON reply line; tests set the
+    reply as return_value.
+    """
+    from services.typescript_parser import TypeScriptParser
+
+    mock_request = Mock()
+    monkeypatch.setattr(TypeScriptParser, "_worker_request", mock_request)
+    return mock_request
+
+
+@pytest.fixture(scope="session")
+def ts_parser() -> Generator[Any, None, None]:
+    """TypeScript parser shared by every test that only calls its methods.
+
+    Construction checks for Node.js and the parser script, so one instance
+    (built with the Node.js check mocked) serves the whole session. The parser
+    also starts a Node.js worker on its first parse; tests that parse with it
+    mock the worker (mock_parser_worker) or parse_file, so none is started,
+    and the parser is closed at the end of the session in case one was.
+    Tests of construction or of the worker itself build their own.
+    """
+    from services.typescript_parser import TypeScriptParser
+
+    # The mocked check must not mark Node.js as verified for other tests
+    with _mocked_node():
+        parser = TypeScriptParser()
+    yield parser
+    parser.close()
+
+
 # Markers for different test types
 def pytest_configure(config):
     """Configure custom pytest markers."""
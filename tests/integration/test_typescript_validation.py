@@ -2,25 +2,248 @@
 
 from pathlib import Path
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
 from services.typescript_parser import TypeScriptParser
 from services.typescript_validator import TypeScriptValidator
 
+# Parser output stood in for the sample files. The validator only reads the
+# AST, so every test shares these.
+_EXAMPLE_AST = {
+    "body": [
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "TSInterfaceDeclaration",
+                "id": {"name": "User"},
+                "loc": {"start": {"line": 12}},
+            },
+        },
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "TSTypeAliasDeclaration",
+                "id": {"name": "Status"},
+                "loc": {"start": {"line": 20}},
+            },
+        },
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "ClassDeclaration",
+                "id": {"name": "UserService"},
+                "loc": {"start": {"line": 26}},
+                "decorators": [],
+            },
+        },
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "ClassDeclaration",
+                "id": {"name": "UserListComponent"},
+                "loc": {"start": {"line": 73}},
+                "decorators": [],
+            },
+        },
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "FunctionDeclaration",
+                "id": {"name": "formatUserName"},
+                "loc": {"start": {"line": 90}},
+                "params": [],
+            },
+        },
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "ClassDeclaration",
+                "id": {"name": "DataProcessor"},
+                "loc": {"start": {"line": 95}},
+                "decorators": [],
+            },
+        },
+    ],
+}
+
+_EXPORTS_BASIC_AST = {
+    "body": [
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "TSInterfaceDeclaration",
+                "id": {"name": "BasicInterface"},
+                "loc": {"start": {"line": 1}},
+            },
+        },
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "ClassDeclaration",
+                "id": {"name": "BasicClass"},
+                "loc": {"start": {"line": 1}},
+                "decorators": [],
+            },
+        },
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "FunctionDeclaration",
+                "id": {"name": "basicFunction"},
+                "loc": {"start": {"line": 1}},
+                "params": [],
+            },
+        },
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "TSTypeAliasDeclaration",
+                "id": {"name": "BasicType"},
+                "loc": {"start": {"line": 1}},
+            },
+        },
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "TSEnumDeclaration",
+                "id": {"name": "BasicEnum"},
+                "loc": {"start": {"line": 1}},
+            },
+        },
+    ],
+}
+
+_EXPORTS_DEFAULT_AST = {
+    "body": [
+        {
+            "type": "ExportDefaultDeclaration",
+            "declaration": {
+                "type": "ClassDeclaration",
+                "id": {"name": "DefaultClass"},
+                "loc": {"start": {"line": 1}},
+                "decorators": [],
+            },
+        },
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "TSInterfaceDeclaration",
+                "id": {"name": "NamedInterface"},
+                "loc": {"start": {"line": 1}},
+            },
+        },
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "FunctionDeclaration",
+                "id": {"name": "namedFunction"},
+                "loc": {"start": {"line": 1}},
+                "params": [],
+            },
+        },
+    ],
+}
+
+_EXPORTS_NESTED_AST = {
+    "body": [
+        {
+            "type": "TSModuleDeclaration",
+            "id": {"name": "OuterNamespace"},
+            "body": {
+                "type": "TSModuleBlock",
+                "body": [
+                    {
+                        "type": "ExportNamedDeclaration",
+                        "declaration": {
+                            "type": "TSInterfaceDeclaration",
+                            "id": {"name": "NestedInterface"},
+                            "loc": {"start": {"line": 1}},
+                        },
+                    },
+                    {
+                        "type": "ExportNamedDeclaration",
+                        "declaration": {
+                            "type": "ClassDeclaration",
+                            "id": {"name": "NestedClass"},
+                            "loc": {"start": {"line": 1}},
+                            "decorators": [],
+                        },
+                    },
+                    {
+                        "type": "ExportNamedDeclaration",
+                        "declaration": {
+                            "type": "FunctionDeclaration",
+                            "id": {"name": "nestedFunction"},
+                            "loc": {"start": {"line": 1}},
+                            "params": [],
+                        },
+                    },
+                ],
+            },
+            "loc": {"start": {"line": 1}},
+        },
+    ],
+}
+
+_BASIC_PAIR_AST = {
+    "body": [
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "TSInterfaceDeclaration",
+                "id": {"name": "BasicInterface"},
+                "loc": {"start": {"line": 1}},
+            },
+        },
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "ClassDeclaration",
+                "id": {"name": "BasicClass"},
+                "loc": {"start": {"line": 1}},
+                "decorators": [],
+            },
+        },
+    ],
+}
+
+_BASIC_INTERFACE_AST = {
+    "body": [
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "TSInterfaceDeclaration",
+                "id": {"name": "BasicInterface"},
+                "loc": {"start": {"line": 1}},
+            },
+        },
+    ],
+}
+
+_DEFAULT_CLASS_AST = {
+    "body": [
+        {
+            "type": "ExportDefaultDeclaration",
+            "declaration": {
+                "type": "ClassDeclaration",
+                "id": {"name": "DefaultClass"},
+                "loc": {"start": {"line": 1}},
+                "decorators": [],
+            },
+        },
+    ],
+}
+
 
 class TestTypeScriptFileValidation:
     """Integration tests validating parser output against known test files."""
 
     @pytest.fixture
-    @patch("services.typescript_parser.subprocess.run")
-    def validator(self, mock_run: Mock) -> TypeScriptValidator:
+    def validator(self, ts_parser: TypeScriptParser) -> TypeScriptValidator:
         """Create a validator instance for testing."""
-        # Mock Node.js check
-        mock_run.return_value = Mock(returncode=0, stdout="v18.0.0\n")
-        parser = TypeScriptParser()
-        return TypeScriptValidator(parser=parser)
+        return TypeScriptValidator(parser=ts_parser)
 
     @pytest.fixture
     def test_samples_dir(self) -> Path:
@@ -36,64 +259,6 @@ class TestTypeScriptFileValidation:
         """Test validation of the example.ts test file."""
         file_path = test_samples_dir / "example.ts"
 
-        # Mock parser's parse_file method to avoid requiring Node.js
-        mock_ast = {
-            "body": [
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "TSInterfaceDeclaration",
-                        "id": {"name": "User"},
-                        "loc": {"start": {"line": 12}},
-                    },
-                },
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "TSTypeAliasDeclaration",
-                        "id": {"name": "Status"},
-                        "loc": {"start": {"line": 20}},
-                    },
-                },
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "ClassDeclaration",
-                        "id": {"name": "UserService"},
-                        "loc": {"start": {"line": 26}},
-                        "decorators": [],
-                    },
-                },
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "ClassDeclaration",
-                        "id": {"name": "UserListComponent"},
-                        "loc": {"start": {"line": 73}},
-                        "decorators": [],
-                    },
-                },
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "FunctionDeclaration",
-                        "id": {"name": "formatUserName"},
-                        "loc": {"start": {"line": 90}},
-                        "params": [],
-                    },
-                },
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "ClassDeclaration",
-                        "id": {"name": "DataProcessor"},
-                        "loc": {"start": {"line": 95}},
-                        "decorators": [],
-                    },
-                },
-            ],
-        }
-
         # Expected exports based on example.ts content
         expected_exports = [
             {
@@ -128,7 +293,7 @@ class TestTypeScriptFileValidation:
             },
         ]
 
-        with patch.object(validator.parser, "parse_file", return_value=mock_ast):
+        with patch.object(validator.parser, "parse_file", return_value=_EXAMPLE_AST):
             result = validator.validate_file(file_path, expected_exports, strict=False)
 
             assert result.is_valid, f"Validation failed: {result.errors}"
@@ -143,53 +308,6 @@ class TestTypeScriptFileValidation:
         """Test validation of basic exports file."""
         file_path = test_samples_dir / "exports-basic.ts"
 
-        mock_ast = {
-            "body": [
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "TSInterfaceDeclaration",
-                        "id": {"name": "BasicInterface"},
-                        "loc": {"start": {"line": 1}},
-                    },
-                },
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "ClassDeclaration",
-                        "id": {"name": "BasicClass"},
-                        "loc": {"start": {"line": 1}},
-                        "decorators": [],
-                    },
-                },
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "FunctionDeclaration",
-                        "id": {"name": "basicFunction"},
-                        "loc": {"start": {"line": 1}},
-                        "params": [],
-                    },
-                },
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "TSTypeAliasDeclaration",
-                        "id": {"name": "BasicType"},
-                        "loc": {"start": {"line": 1}},
-                    },
-                },
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "TSEnumDeclaration",
-                        "id": {"name": "BasicEnum"},
-                        "loc": {"start": {"line": 1}},
-                    },
-                },
-            ],
-        }
-
         expected_exports = [
             {
                 "symbol": "BasicInterface",
@@ -218,7 +336,9 @@ class TestTypeScriptFileValidation:
             },
         ]
 
-        with patch.object(validator.parser, "parse_file", return_value=mock_ast):
+        with patch.object(
+            validator.parser, "parse_file", return_value=_EXPORTS_BASIC_AST
+        ):
             result = validator.validate_file(file_path, expected_exports, strict=False)
 
         assert result.is_valid, f"Validation failed: {result.errors}"
@@ -238,37 +358,6 @@ class TestTypeScriptFileValidation:
         """Test validation of default exports file."""
         file_path = test_samples_dir / "exports-default.ts"
 
-        mock_ast = {
-            "body": [
-                {
-                    "type": "ExportDefaultDeclaration",
-                    "declaration": {
-                        "type": "ClassDeclaration",
-                        "id": {"name": "DefaultClass"},
-                        "loc": {"start": {"line": 1}},
-                        "decorators": [],
-                    },
-                },
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "TSInterfaceDeclaration",
-                        "id": {"name": "NamedInterface"},
-                        "loc": {"start": {"line": 1}},
-                    },
-                },
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "FunctionDeclaration",
-                        "id": {"name": "namedFunction"},
-                        "loc": {"start": {"line": 1}},
-                        "params": [],
-                    },
-                },
-            ],
-        }
-
         expected_exports = [
             {
                 "symbol": "DefaultClass",  # Default export name
@@ -287,7 +376,9 @@ class TestTypeScriptFileValidation:
             },
         ]
 
-        with patch.object(validator.parser, "parse_file", return_value=mock_ast):
+        with patch.object(
+            validator.parser, "parse_file", return_value=_EXPORTS_DEFAULT_AST
+        ):
             result = validator.validate_file(file_path, expected_exports, strict=False)
 
             assert result.is_valid, f"Validation failed: {result.errors}"
@@ -307,47 +398,6 @@ class TestTypeScriptFileValidation:
         """Test validation of nested exports in namespaces."""
         file_path = test_samples_dir / "exports-nested.ts"
 
-        mock_ast = {
-            "body": [
-                {
-                    "type": "TSModuleDeclaration",
-                    "id": {"name": "OuterNamespace"},
-                    "body": {
-                        "type": "TSModuleBlock",
-                        "body": [
-                            {
-                                "type": "ExportNamedDeclaration",
-                                "declaration": {
-                                    "type": "TSInterfaceDeclaration",
-                                    "id": {"name": "NestedInterface"},
-                                    "loc": {"start": {"line": 1}},
-                                },
-                            },
-                            {
-                                "type": "ExportNamedDeclaration",
-                                "declaration": {
-                                    "type": "ClassDeclaration",
-                                    "id": {"name": "NestedClass"},
-                                    "loc": {"start": {"line": 1}},
-                                    "decorators": [],
-                                },
-                            },
-                            {
-                                "type": "ExportNamedDeclaration",
-                                "declaration": {
-                                    "type": "FunctionDeclaration",
-                                    "id": {"name": "nestedFunction"},
-                                    "loc": {"start": {"line": 1}},
-                                    "params": [],
-                                },
-                            },
-                        ],
-                    },
-                    "loc": {"start": {"line": 1}},
-                },
-            ],
-        }
-
         expected_exports = [
             # Nested exports should be extracted (namespace itself is not exported)
             {
@@ -379,7 +429,9 @@ class TestTypeScriptFileValidation:
             },
         ]
 
-        with patch.object(validator.parser, "parse_file", return_value=mock_ast):
+        with patch.object(
+            validator.parser, "parse_file", return_value=_EXPORTS_NESTED_AST
+        ):
             result = validator.validate_file(file_path, expected_exports, strict=False)
 
             # In non-strict mode, nested exports may or may not be extracted
@@ -417,40 +469,8 @@ class TestTypeScriptFileValidation:
 
         # Mock ASTs for both files
         mock_asts = {
-            str(test_samples_dir / "exports-basic.ts"): {
-                "body": [
-                    {
-                        "type": "ExportNamedDeclaration",
-                        "declaration": {
-                            "type": "TSInterfaceDeclaration",
-                            "id": {"name": "BasicInterface"},
-                            "loc": {"start": {"line": 1}},
-                        },
-                    },
-                    {
-                        "type": "ExportNamedDeclaration",
-                        "declaration": {
-                            "type": "ClassDeclaration",
-                            "id": {"name": "BasicClass"},
-                            "loc": {"start": {"line": 1}},
-                            "decorators": [],
-                        },
-                    },
-                ],
-            },
-            str(test_samples_dir / "exports-default.ts"): {
-                "body": [
-                    {
-                        "type": "ExportDefaultDeclaration",
-                        "declaration": {
-                            "type": "ClassDeclaration",
-                            "id": {"name": "DefaultClass"},
-                            "loc": {"start": {"line": 1}},
-                            "decorators": [],
-                        },
-                    },
-                ],
-            },
+            str(test_samples_dir / "exports-basic.ts"): _BASIC_PAIR_AST,
+            str(test_samples_dir / "exports-default.ts"): _DEFAULT_CLASS_AST,
         }
 
         def mock_parse_file(file_path: str) -> dict[str, Any]:
@@ -474,29 +494,6 @@ class TestTypeScriptFileValidation:
         """Test that strict mode enforces exact matching."""
         file_path = test_samples_dir / "exports-basic.ts"
 
-        # Mock AST with exactly 2 exports
-        mock_ast = {
-            "body": [
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "TSInterfaceDeclaration",
-                        "id": {"name": "BasicInterface"},
-                        "loc": {"start": {"line": 1}},
-                    },
-                },
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "ClassDeclaration",
-                        "id": {"name": "BasicClass"},
-                        "loc": {"start": {"line": 1}},
-                        "decorators": [],
-                    },
-                },
-            ],
-        }
-
         # Expected exports with exact count
         expected_exports = [
             {"symbol": "BasicInterface", "type": "interface", "isDefault": False},
@@ -504,7 +501,7 @@ class TestTypeScriptFileValidation:
         ]
 
         # In strict mode, if there are more exports than expected, it should fail
-        with patch.object(validator.parser, "parse_file", return_value=mock_ast):
+        with patch.object(validator.parser, "parse_file", return_value=_BASIC_PAIR_AST):
             result = validator.validate_file(file_path, expected_exports, strict=True)
 
             # Should either pass if exact match, or have warnings/errors if extra exports
@@ -564,20 +561,9 @@ class TestTypeScriptFileValidation:
             {"symbol": "BasicInterface", "type": "interface", "isDefault": False},
         ]
 
-        mock_ast = {
-            "body": [
-                {
-                    "type": "ExportNamedDeclaration",
-                    "declaration": {
-                        "type": "TSInterfaceDeclaration",
-                        "id": {"name": "BasicInterface"},
-                        "loc": {"start": {"line": 1}},
-                    },
-                },
-            ],
-        }
-
-        with patch.object(validator.parser, "parse_file", return_value=mock_ast):
+        with patch.object(
+            validator.parser, "parse_file", return_value=_BASIC_INTERFACE_AST
+        ):
             result = validator.validate_file(file_path, expected_exports, strict=False)
 
             assert hasattr(result, "is_valid")
@@ -598,20 +584,6 @@ class TestTypeScriptFileValidation:
         """Test that export properties are correctly validated."""
         file_path = test_samples_dir / "exports-default.ts"
 
-        mock_ast = {
-            "body": [
-                {
-                    "type": "ExportDefaultDeclaration",
-                    "declaration": {
-                        "type": "ClassDeclaration",
-                        "id": {"name": "DefaultClass"},
-                        "loc": {"start": {"line": 1}},
-                        "decorators": [],
-                    },
-                },
-            ],
-        }
-
         expected_exports = [
             {
                 "symbol": "DefaultClass",
@@ -621,7 +593,9 @@ class TestTypeScriptFileValidation:
             },
         ]
 
-        with patch.object(validator.parser, "parse_file", return_value=mock_ast):
+        with patch.object(
+            validator.parser, "parse_file", return_value=_DEFAULT_CLASS_AST
+        ):
             result = validator.validate_file(file_path, expected_exports, strict=False)
 
             # Find the default export in actual exports
@@ -106,3 +106,28 @@ def test_create_page_failure_without_snapshot_propagates_original() -> None:
         publisher.create_page(payload)
 
     client.update_page.assert_not_called()
+
+
+def test_update_page_skipped_in_test_mode() -> None:
+    client = Mock()
+    publisher = ConfluencePublisher(client=client, run_mode="TEST")
+
+    result = publisher.update_page({"id": "42", "content": "<new>"})
+
+    assert result == {"id": "42", "status": "test_mode_skipped"}
+    client.get_page.assert_not_called()
+    client.update_page.assert_not_called()
+
+
+def test_create_page_skipped_in_test_mode() -> None:
+    client = Mock()
+    registry = PageRollbackRegistry()
+    publisher = ConfluencePublisher(
+        client=client, rollback_registry=registry, run_mode="TEST"
+    )
+
+    result = publisher.create_page({"id": "abc", "content": "<generated>"})
+
+    assert result == {"id": "abc", "status": "test_mode_skipped"}
+    client.create_page.assert_not_called()
+    assert registry.latest_snapshot("abc") is None
@@ -169,6 +169,33 @@ class TestConstraints:
             test_session.delete(run)
             test_session.commit()
 
+    def test_run_column_defaults(self, test_session):
+        """Test that Run fills started_at and mode when they are not given."""
+        before = datetime.utcnow()
+        run = Run(
+            repo="test/repo",
+            branch="main",
+            commit_sha="abc123",
+            correlation_id="test-id",
+        )
+        test_session.add(run)
+        test_session.commit()
+
+        assert run.started_at >= before.replace(microsecond=0)
+        assert run.mode == "PRODUCTION"
+        assert run.status == "Awaiting Review"
+
+    def test_run_mode_server_default(self, test_engine):
+        """Test that rows inserted outside the ORM default to PRODUCTION mode."""
+        with test_engine.begin() as conn:
+            conn.exec_driver_sql(
+                "INSERT INTO runs (repo, branch, commit_sha, started_at, status, "
+                "correlation_id, is_dry_run) VALUES "
+                "('r', 'main', 'abc', '2025-01-01 00:00:00', 'Success', 'c', 0)"
+            )
+            mode = conn.exec_driver_sql("SELECT mode FROM runs").scalar_one()
+        assert mode == "PRODUCTION"
+
     def test_change_type_constraint(self, test_session):
         """Test Change change_type check constraint."""
         # First create a run
@@ -101,6 +101,16 @@ class TestTemplateEngineStorageFormat:
         assert "&amp;" in result
         # Validation ensures XML is well-formed
 
+    def test_render_storage_format_escaping_matches_html_escape(self):
+        """Test that Storage Format escaping produces html.escape entities."""
+        from html import escape
+
+        value = '<a href="x">Tom & Jerry\'s</a>'
+        result = TemplateEngine.render(
+            "<p>{{content}}</p>", "Storage", {"content": value}
+        )
+        assert result == f"<p>{escape(value)}</p>"
+
     def test_render_storage_format_valid_xml(self):
         """Test that rendered Storage Format produces valid XML."""
         template = """<ac:structured-macro ac:name="code">
@@ -113,6 +123,24 @@ class TestTemplateEngineStorageFormat:
         assert "python" in result
         assert "def hello()" in result
 
+    def test_render_storage_format_cdata_values_are_not_escaped(self):
+        """Test that values inside CDATA are written raw, not entity-escaped."""
+        template = (
+            "<p>{{code}}</p><ac:plain-text-body><![CDATA[{{code}}]]>"
+            "</ac:plain-text-body>"
+        )
+        result = TemplateEngine.render(template, "Storage", {"code": "a < b && c"})
+        assert result == (
+            "<p>a &lt; b &amp;&amp; c</p>"
+            "<ac:plain-text-body><![CDATA[a < b && c]]></ac:plain-text-body>"
+        )
+
+    def test_render_storage_format_cdata_terminator_is_split(self):
+        """Test that a "]]>" value cannot close the CDATA section early."""
+        template = "<p><![CDATA[{{code}}]]></p>"
+        result = TemplateEngine.render(template, "Storage", {"code": "x]]><script/>"})
+        assert "<![CDATA[x]]]]><![CDATA[><script/>]]>" in result
+
     def test_render_storage_format_invalid_xml_raises_error(self):
         """Test that invalid XML in template raises TemplateValidationError."""
         # Template that produces invalid XML (unclosed tag)
@@ -121,6 +149,23 @@ class TestTemplateEngineStorageFormat:
         with pytest.raises(TemplateValidationError):
             TemplateEngine.render(invalid_template, "Storage", variables)
 
+    @pytest.mark.parametrize(
+        ("template", "variables", "expected"),
+        [
+            ("<{{tag}}>x</{{tag}}>", {"tag": "p"}, "<p>x</p>"),
+            ("<p>&{{e}};</p>", {"e": "amp"}, "<p>&amp;</p>"),
+        ],
+        ids=["tag_name", "entity_name"],
+    )
+    def test_render_storage_format_placeholders_completing_markup(
+        self, template, variables, expected
+    ):
+        """Test templates that are only well-formed once rendered."""
+        assert TemplateEngine.render(template, "Storage", variables) == expected
+        # Still rejected when the rendered output is not well-formed
+        with pytest.raises(TemplateValidationError):
+            TemplateEngine.render(template, "Storage", {})
+
     def test_render_storage_format_missing_variable(self):
         """Test that missing variables are left as-is in Storage Format."""
         template = "<p>{{name}} is {{age}} years old</p>"
@@ -130,6 +175,18 @@ class TestTemplateEngineStorageFormat:
         assert "{{age}}" in result  # Missing variable left as-is
         # Validation ensures XML is well-formed
 
+    def test_render_storage_format_illegal_xml_character_raises_error(self):
+        """Test that XML-illegal characters in values still fail validation."""
+        with pytest.raises(TemplateValidationError):
+            TemplateEngine.render("<p>{{content}}</p>", "Storage", {"content": "\x01"})
+
+    def test_render_storage_format_comment_value_is_validated(self):
+        """Test that values rendered inside XML comments are validated."""
+        template = "<p><!-- {{note}} --></p>"
+        assert TemplateEngine.render(template, "Storage", {"note": "ok"})
+        with pytest.raises(TemplateValidationError):
+            TemplateEngine.render(template, "Storage", {"note": "a -- b"})
+
     def test_render_storage_format_empty_template(self):
         """Test rendering empty Storage Format template."""
         result = TemplateEngine.render("", "Storage", {})
@@ -174,6 +231,16 @@ class TestTemplateEngineValidation:
             TemplateEngine.render(malformed_template, "Storage", variables)
         assert "Invalid Confluence Storage Format XML" in str(exc_info.value)
 
+    @pytest.mark.parametrize("template", ["<p>&nbsp;</p>", "<p>{{x}}&nbsp;</p>"])
+    def test_storage_format_validation_reports_undefined_entity(self, template):
+        """Test that the first real XML error is the one reported."""
+        with pytest.raises(TemplateValidationError) as exc_info:
+            TemplateEngine.render(template, "Storage", {"x": "value"})
+        message = str(exc_info.value)
+        assert "entity" in message.lower()
+        assert "nbsp" in message or "undefined entity" in message
+        assert "invalid element name" not in message
+
     def test_storage_format_validation_catches_invalid_tags(self):
         """Test that Storage Format validation catches invalid XML tags."""
         # Template with invalid tag structure
@@ -290,6 +357,28 @@ class TestTemplateEngineStructuredErrors:
         assert error2.code == "TEMPLATE_SYNTAX_ERROR"
         assert "nested placeholder" in error2.message.lower()
 
+    def test_syntax_error_reports_each_callers_template_id(self):
+        """Test that compile-time syntax errors carry the rendering template ID."""
+        from autodoc.templates.engine import TemplateEngine, TemplateSyntaxError
+
+        for template_id in (7, 8, None):
+            with pytest.raises(TemplateSyntaxError) as exc_info:
+                TemplateEngine.render("{{a", "Markdown", {}, template_id=template_id)
+            assert exc_info.value.template_id == template_id
+
+    def test_render_template_reports_the_entity_id(self):
+        """Test that render_template renders a Template entity on the class."""
+        from types import SimpleNamespace
+
+        from autodoc.templates.engine import MissingVariableError, TemplateEngine
+
+        template = SimpleNamespace(id=5, body="# {{title}}", format="Markdown")
+        assert TemplateEngine.render_template(template, {"title": "API"}) == "# API"
+
+        with pytest.raises(MissingVariableError) as exc_info:
+            TemplateEngine.render_template(template, {}, strict_mode=True)
+        assert exc_info.value.template_id == 5
+
     def test_invalid_format_enum(self):
         """Test UnsupportedFormatError for invalid format enum."""
         from autodoc.templates.engine import (
@@ -345,6 +434,15 @@ class TestTemplateEngineStructuredErrors:
             "template_id": 1,
             "variable": "test_var",
         }
+        # Each call reflects the current attributes in a fresh dictionary
+        missing_dict["code"] = "CHANGED"
+        missing_error.template_id = 4
+        assert missing_error.to_dict() == {
+            "code": "MISSING_VARIABLE",
+            "message": "Required variable 'test_var' is missing",
+            "template_id": 4,
+            "variable": "test_var",
+        }
 
         # Test TemplateSyntaxError structured info
         syntax_error = TemplateSyntaxError(
@@ -369,3 +467,158 @@ class TestTemplateEngineStructuredErrors:
         format_dict = format_error.to_dict()
         assert format_dict["code"] == "UNSUPPORTED_FORMAT"
         assert format_dict["template_id"] == 3
+
+
+class TestTemplateEngineBraceSyntax:
+    """Tests for placeholder brace scanning and matching."""
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "a}} {{b}}",  # closer before any opener
+            "{{a}} }}",  # trailing stray closer
+            "{{a {{b}} }}",  # opener reopened before it is closed
+        ],
+    )
+    def test_mismatched_braces_are_located(self, template):
+        """Test that unpaired braces are reported even when counts balance."""
+        from autodoc.templates.engine import TemplateEngine, TemplateSyntaxError
+
+        with pytest.raises(TemplateSyntaxError) as exc_info:
+            TemplateEngine.render(template, "Markdown", {"a": 1, "b": 2})
+
+        assert "Mismatched placeholder braces" in exc_info.value.message
+        assert "position" in exc_info.value.message
+
+    def test_placeholder_body_stops_at_next_brace(self):
+        """Test that many unmatched openers are rejected without rescanning."""
+        from autodoc.templates.engine import TemplateEngine, TemplateSyntaxError
+
+        # Balanced counts, but no "{{x" opener has a matching "}}" after it
+        template = "}} " * 5000 + "{{x " * 5000 + "}a"
+        with pytest.raises(TemplateSyntaxError):
+            TemplateEngine.render(template, "Markdown", {"x": "X"})
+
+    def test_long_near_miss_template_is_rendered(self):
+        """Test that a long template full of near-miss placeholders is accepted.
+
+        The pairs holding single braces send the body through
+        PLACEHOLDER_PATTERN, whose failed matches must stop at the next brace.
+        """
+        from autodoc.templates.engine import TemplateEngine
+
+        template = "{{{a}} {{a}b}} {c} " * 5000
+        result = TemplateEngine.render(template, "Markdown", {"a": "A"})
+        assert result == "{A {{a}b}} {c} " * 5000
+
+    @pytest.mark.parametrize(
+        ("template", "expected"),
+        [
+            ("{{{a}}", "{A"),
+            ("{{a}b}}", "{{a}b}}"),
+            ("x {{}} {{a}}}", "x {{}} A}"),
+        ],
+    )
+    def test_braces_inside_placeholder_pairs(self, template, expected):
+        """Test that brace pairs holding single braces render as before."""
+        from autodoc.templates.engine import TemplateEngine
+
+        assert TemplateEngine.render(template, "Markdown", {"a": "A"}) == expected
+
+
+class TestTemplateEngineCompiledTemplates:
+    """Tests for compiled templates, placeholder resolution and batch rendering."""
+
+    def test_nested_keys_are_split_at_compile_time(self):
+        """Test that dotted keys are pre-split and resolved by lookup only."""
+        from autodoc.templates.engine import TemplateEngine
+
+        template = "{{ change.symbol.name }} in {{change.file}}"
+        compiled = TemplateEngine._compile(template)
+        assert compiled.lookups == (
+            ("change.symbol.name", ("change", "symbol", "name")),
+            ("change.file", ("change", "file")),
+        )
+
+        variables = {"change": {"symbol": {"name": "foo"}, "file": ["a.py"]}}
+        assert TemplateEngine.render(template, "Markdown", variables) == (
+            "foo in ['a.py']"
+        )
+        # Walking through a non-dict value is treated as a missing variable
+        assert (
+            TemplateEngine.render("{{change.file.name}}", "Markdown", variables)
+            == "{{change.file.name}}"
+        )
+
+    def test_missing_keys_of_dict_subclasses_stay_missing(self):
+        """Test that defaultdict and Counter values do not fill missing keys."""
+        from collections import Counter, defaultdict
+
+        from autodoc.templates.engine import TemplateEngine
+
+        variables = {"x": defaultdict(dict), "c": Counter()}
+        assert (
+            TemplateEngine.render("a {{x.y}} b {{c.z}}", "Markdown", variables)
+            == "a {{x.y}} b {{c.z}}"
+        )
+        assert variables["x"] == {}
+
+    def test_repeated_placeholders_are_resolved_once(self):
+        """Test that each distinct placeholder is compiled to one key entry."""
+        from autodoc.templates.engine import TemplateEngine
+
+        template = "{{name}}, {{name}} and {{other}} - {{name}}"
+        compiled = TemplateEngine._compile(template)
+        assert compiled.texts == ("{{name}}", "{{other}}")
+        assert [key for key, _ in compiled.lookups] == ["name", "other"]
+        assert compiled.order == (0, 0, 1, 0)
+        assert (
+            TemplateEngine.render(template, "Markdown", {"name": "A"})
+            == "A, A and {{other}} - A"
+        )
+
+    def test_values_are_converted_with_str(self):
+        """Test that values render via __str__ and single braces stay literal."""
+        from autodoc.templates.engine import TemplateEngine
+
+        class Version:
+            def __str__(self):
+                return "1.2"
+
+            def __format__(self, spec):
+                return "formatted"
+
+        template = '{"version": "{{meta.version}}", "enabled": {{enabled}}}'
+        variables = {"meta": {"version": Version()}, "enabled": True}
+        assert TemplateEngine.render(template, "Markdown", variables) == (
+            '{"version": "1.2", "enabled": True}'
+        )
+
+    def test_render_many_matches_render(self):
+        """Test that render_many renders a batch like repeated render calls."""
+        from autodoc.templates.engine import TemplateEngine, UnsupportedFormatError
+
+        bodies = ["# {{symbol.name}}", "{{change_type}}: {{symbol.name}}", ""]
+        variables = {"symbol": {"name": "foo"}, "change_type": "added"}
+        assert TemplateEngine.render_many(bodies, "Markdown", variables) == [
+            TemplateEngine.render(body, "Markdown", variables) for body in bodies
+        ]
+
+        with pytest.raises(UnsupportedFormatError):
+            TemplateEngine.render_many(bodies, "HTML", variables)
+
+    def test_render_many_converts_each_value_once(self):
+        """Test that render_many resolves a key once for the whole batch."""
+        from autodoc.templates.engine import TemplateEngine
+
+        class Counted:
+            calls = 0
+
+            def __str__(self):
+                Counted.calls += 1
+                return "v"
+
+        bodies = ["{{a.b}}", "x {{a.b}}", "{{ a.b }} {{c}}"]
+        result = TemplateEngine.render_many(bodies, "Markdown", {"a": {"b": Counted()}})
+        assert result == ["v", "x v", "v {{c}}"]
+        assert Counted.calls == 1
@@ -1,5 +1,8 @@
 """Unit tests for token masking (FR-28, NFR-9)."""
 
+import pytest
+
+from core.security_middleware import SecurityLoggingMiddleware
 from core.token_masking import mask_token, mask_payload, mask_dict_keys
 
 
@@ -102,6 +105,33 @@ class TestMaskPayload:
         assert masked["api_token"] == "token_value"  # Not in custom keys
         assert masked["public_field"] == "public_value"
 
+    def test_payload_without_sensitive_keys_is_not_copied(self):
+        """Test that a payload with nothing to mask is returned unchanged."""
+        payload = {"space_key": "DOCS", "nested": {"url": "https://test.com"}}
+
+        assert mask_payload(payload) is payload
+        assert mask_payload(payload, deep=True) is payload
+
+        payload["nested"]["api_key"] = "KEY"
+        assert mask_payload(payload) is payload
+        masked = mask_payload(payload, deep=True)
+        assert masked is not payload
+        assert masked["nested"]["api_key"] == "••••••••••"
+        assert payload["nested"]["api_key"] == "KEY"
+
+    def test_mask_deeply_nested_payload(self):
+        """Test deep masking beyond the interpreter's recursion limit."""
+        payload: dict = {"api_token": "TOKEN_AT_DEPTH"}
+        for _ in range(5000):
+            payload = {"child": payload, "password": None}
+        masked = mask_payload(payload, deep=True)
+
+        node = masked
+        for _ in range(5000):
+            assert node["password"] is None  # None values are left as-is
+            node = node["child"]
+        assert node["api_token"] == "••••••••••"
+
 
 class TestMaskDictKeys:
     """Test mask_dict_keys function."""
@@ -116,3 +146,26 @@ class TestMaskDictKeys:
 
         assert masked["api_token"] == "••••••••••"
         assert masked["other_field"] == "value"
+
+
+class TestMaskLogString:
+    """Test SecurityLoggingMiddleware._mask_string."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("ATATTxyz", "ATATT••••••••"),
+            ("key ATATTabcdefgh", "key ATATT••••••••"),
+            ("short message", "short message"),
+            (
+                "failed with abcdefghijklmnopqrstuvwxyz",
+                "failed with abcdefgh••••••••",
+            ),
+        ],
+        ids=["short_atatt", "short_atatt_in_text", "short_plain", "token_like"],
+    )
+    def test_mask_string(self, text, expected):
+        """Test that Confluence tokens are masked whatever the text length."""
+        middleware = SecurityLoggingMiddleware(app=None)
+
+        assert middleware._mask_string(text) == expected
@@ -1,5 +1,6 @@
 """Unit tests for TypeScript analyzer JSDoc extraction and validation."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -9,15 +10,165 @@ import pytest
 from autodoc.analysis.ts_analyzer import TypeScriptAnalyzer
 
 
-@pytest.fixture
-def ts_analyzer() -> TypeScriptAnalyzer:
-    """Create a TypeScript analyzer instance for testing."""
-    return TypeScriptAnalyzer()
+# Mock AST data shared by the tests below (the analyzer only reads it)
+_MOCK_AST_BASIC: dict[str, Any] = {
+    "nodes": [
+        {
+            "kind": "FunctionDeclaration",
+            "text": "function greet(name: string, age: number): string",
+            "start": 100,
+            "end": 200,
+            "leadingComments": [
+                {
+                    "kind": "multi-line",
+                    "text": "/**\n * This is a simple function with JSDoc.\n * @param {string} name - The name parameter\n */",
+                    "pos": 0,
+                    "end": 100,
+                    "isJSDoc": True,
+                },
+            ],
+        },
+    ],
+}
+
+_MOCK_AST_EMPTY: dict[str, Any] = {"nodes": []}
+
+_MOCK_AST_NON_JSDOC: dict[str, Any] = {
+    "nodes": [
+        {
+            "kind": "FunctionDeclaration",
+            "text": "function test()",
+            "leadingComments": [
+                {
+                    "kind": "single-line",
+                    "text": "// This is a regular comment",
+                    "isJSDoc": False,
+                },
+            ],
+        },
+    ],
+}
+
+_MOCK_AST_SYMBOL_WITH_JSDOC: dict[str, Any] = {
+    "nodes": [
+        {
+            "kind": "FunctionDeclaration",
+            "text": "function greet(name: string): string",
+            "start": 100,
+            "end": 150,
+            "leadingComments": [
+                {
+                    "kind": "multi-line",
+                    "text": "/**\n * Greeting function.\n * @param {string} name\n */",
+                    "pos": 0,
+                    "end": 99,
+                    "isJSDoc": True,
+                },
+            ],
+        },
+    ],
+}
 
+_MOCK_AST_SYMBOL_WITHOUT_JSDOC: dict[str, Any] = {
+    "nodes": [
+        {
+            "kind": "FunctionDeclaration",
+            "text": "function test(): void",
+            "start": 100,
+            "end": 150,
+            "leadingComments": [],
+        },
+    ],
+}
 
-@pytest.fixture
-def sample_ts_file(temp_dir: Path) -> Path:
-    """Create a sample TypeScript file with JSDoc comments for testing."""
+_MOCK_AST_MULTI_SYMBOL: dict[str, Any] = {
+    "nodes": [
+        {
+            "kind": "FunctionDeclaration",
+            "text": "function func1(): void",
+            "start": 100,
+            "end": 150,
+            "leadingComments": [
+                {
+                    "kind": "multi-line",
+                    "text": "/**\n * Function 1\n */",
+                    "pos": 0,
+                    "end": 99,
+                    "isJSDoc": True,
+                },
+            ],
+        },
+        {
+            "kind": "FunctionDeclaration",
+            "text": "function func2(): void",
+            "start": 200,
+            "end": 250,
+            "leadingComments": [
+                {
+                    "kind": "multi-line",
+                    "text": "/**\n * Function 2\n */",
+                    "pos": 151,
+                    "end": 199,
+                    "isJSDoc": True,
+                },
+            ],
+        },
+    ],
+}
+
+_MOCK_AST_CLASS_METHOD: dict[str, Any] = {
+    "nodes": [
+        {
+            "kind": "ClassDeclaration",
+            "text": "class Calculator",
+            "start": 100,
+            "end": 200,
+            "leadingComments": [
+                {
+                    "kind": "multi-line",
+                    "text": "/**\n * Calculator class\n */",
+                    "pos": 0,
+                    "end": 99,
+                    "isJSDoc": True,
+                },
+            ],
+        },
+        {
+            "kind": "MethodDeclaration",
+            "text": "add(a: number, b: number): number",
+            "start": 201,
+            "end": 250,
+            "leadingComments": [
+                {
+                    "kind": "multi-line",
+                    "text": "/**\n * Add method\n */",
+                    "pos": 151,
+                    "end": 200,
+                    "isJSDoc": True,
+                },
+            ],
+        },
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def ts_analyzer() -> Iterator[TypeScriptAnalyzer]:
+    """Create a TypeScript analyzer instance shared by this module's tests.
+
+    The analyzer holds no per-file state, so one instance (and one Node.js
+    parser process) serves every test. Only declarations and their JSDoc are
+    checked, so bodies are not parsed. Tests that touch the AST cache use
+    their own temp_dir, so the module also runs unchanged on a pytest-xdist
+    worker (one analyzer per worker with --dist=loadfile).
+    """
+    with TypeScriptAnalyzer(analyze_bodies=False) as analyzer:
+        yield analyzer
+
+
+@pytest.fixture(scope="module")
+def sample_ts_source() -> tuple[str, str]:
+    """Sample TypeScript source with JSDoc comments, as (source, virtual path)."""
     ts_code = """
 /**
  * This is a simple function with JSDoc.
@@ -66,14 +217,12 @@ interface User {
     email: string;
 }
 """
-    file_path = temp_dir / "test.ts"
-    file_path.write_text(ts_code, encoding="utf-8")
-    return file_path
+    return ts_code, "test.ts"
 
 
-@pytest.fixture
-def sample_ts_file_complex(temp_dir: Path) -> Path:
-    """Create a complex TypeScript file with multiple JSDoc patterns."""
+@pytest.fixture(scope="module")
+def sample_ts_source_complex() -> tuple[str, str]:
+    """Complex TypeScript source with multiple JSDoc patterns, as (source, virtual path)."""
     ts_code = """
 /**
  * Multi-line description.
@@ -110,7 +259,16 @@ function simpleFunction(): void {
     // No JSDoc tags
 }
 """
-    file_path = temp_dir / "complex.ts"
+    return ts_code, "complex.ts"
+
+
+@pytest.fixture(scope="module")
+def sample_ts_file(
+    tmp_path_factory: pytest.TempPathFactory, sample_ts_source: tuple[str, str]
+) -> Path:
+    """Write the sample source to disk, for the tests that need a real file."""
+    ts_code, name = sample_ts_source
+    file_path = tmp_path_factory.mktemp("ts_samples") / name
     file_path.write_text(ts_code, encoding="utf-8")
     return file_path
 
@@ -120,35 +278,10 @@ class TestJSDocCommentExtraction:
 
     @pytest.mark.unit
     @pytest.mark.analyzer
-    def test_extract_jsdoc_comments_basic(
-        self,
-        ts_analyzer: TypeScriptAnalyzer,
-        sample_ts_file: Path,
-    ):
+    def test_extract_jsdoc_comments_basic(self, ts_analyzer: TypeScriptAnalyzer):
         """Test that JSDoc comments are correctly extracted from TypeScript files."""
-        # Mock the AST parsing to return expected structure
-        mock_ast_data: dict[str, Any] = {
-            "nodes": [
-                {
-                    "kind": "FunctionDeclaration",
-                    "text": "function greet(name: string, age: number): string",
-                    "start": 100,
-                    "end": 200,
-                    "leadingComments": [
-                        {
-                            "kind": "multi-line",
-                            "text": "/**\n * This is a simple function with JSDoc.\n * @param {string} name - The name parameter\n */",
-                            "pos": 0,
-                            "end": 100,
-                            "isJSDoc": True,
-                        },
-                    ],
-                },
-            ],
-        }
-
-        with patch.object(ts_analyzer, "_parse_ast", return_value=mock_ast_data):
-            result = ts_analyzer._extract_jsdoc_comments(mock_ast_data)
+        with patch.object(ts_analyzer, "_parse_ast", return_value=_MOCK_AST_BASIC):
+            result = ts_analyzer._extract_jsdoc_comments(_MOCK_AST_BASIC)
 
         assert len(result) > 0
         assert result[0]["raw_text"].startswith("/**")
@@ -159,30 +292,14 @@ class TestJSDocCommentExtraction:
     @pytest.mark.analyzer
     def test_extract_jsdoc_comments_empty(self, ts_analyzer: TypeScriptAnalyzer):
         """Test extraction with no JSDoc comments."""
-        mock_ast_data: dict[str, Any] = {"nodes": []}
-        result = ts_analyzer._extract_jsdoc_comments(mock_ast_data)
+        result = ts_analyzer._extract_jsdoc_comments(_MOCK_AST_EMPTY)
         assert result == []
 
     @pytest.mark.unit
     @pytest.mark.analyzer
     def test_extract_jsdoc_comments_non_jsdoc(self, ts_analyzer: TypeScriptAnalyzer):
         """Test that non-JSDoc comments are not extracted."""
-        mock_ast_data = {
-            "nodes": [
-                {
-                    "kind": "FunctionDeclaration",
-                    "text": "function test()",
-                    "leadingComments": [
-                        {
-                            "kind": "single-line",
-                            "text": "// This is a regular comment",
-                            "isJSDoc": False,
-                        },
-                    ],
-                },
-            ],
-        }
-        result = ts_analyzer._extract_jsdoc_comments(mock_ast_data)
+        result = ts_analyzer._extract_jsdoc_comments(_MOCK_AST_NON_JSDOC)
         assert result == []
 
 
@@ -231,6 +348,21 @@ class TestJSDocNormalization:
         assert "Paragraph one." in lines[0]
         assert "Paragraph two." in lines[2] or "Paragraph two." in lines[1]
 
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_normalize_comment_text_is_cached_across_analyzers(self):
+        """Test that a recurring comment is normalized once for all analyzers."""
+        raw = "/**\n * Copyright (c) Example Corp.\n * Licensed under MIT.\n */"
+        normalize = TypeScriptAnalyzer._normalize_comment_text
+        normalize.cache_clear()
+
+        first = TypeScriptAnalyzer()._normalize_comment_text(raw)
+        second = TypeScriptAnalyzer()._normalize_comment_text(raw)
+
+        assert first == second == "Copyright (c) Example Corp.\nLicensed under MIT."
+        assert normalize.cache_info().misses == 1
+        assert normalize.cache_info().hits == 1
+
 
 class TestJSDocTagParsing:
     """Test suite for JSDoc tag parsing accuracy."""
@@ -367,6 +499,30 @@ example code
         assert len(tags["custom"]) > 0
         assert tags["custom"][0]["tag"] == "customtag"
 
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_parse_every_tag_kind_in_one_comment(self, ts_analyzer: TypeScriptAnalyzer):
+        """Test that known and custom tag kinds are all recognized in one pass."""
+        normalized = """@param {string} name The name
+@returns {boolean} Whether it worked
+@deprecated Use other()
+@throws {Error} On failure
+@example f("x")
+@see other
+@since 2.0.0
+@author Jane Doe
+@version 3.1.0
+@type {Foo} A foo
+@typedef {Object} Options The options
+@internal Not public"""
+        tags = ts_analyzer._parse_jsdoc_tags(normalized)
+
+        for field in ("params", "throws", "examples", "see", "author"):
+            assert len(tags[field]) == 1
+        for field in ("returns", "deprecated", "type", "typedef"):
+            assert tags[field] is not None
+        assert [t["tag"] for t in tags["custom"]] == ["internal"]
+
 
 class TestSymbolJSDocLinkage:
     """Test suite for symbol-JSDoc linkage accuracy."""
@@ -375,27 +531,7 @@ class TestSymbolJSDocLinkage:
     @pytest.mark.analyzer
     def test_symbol_with_jsdoc(self, ts_analyzer: TypeScriptAnalyzer):
         """Test that symbols correctly link to their JSDoc comments."""
-        mock_ast_data = {
-            "nodes": [
-                {
-                    "kind": "FunctionDeclaration",
-                    "text": "function greet(name: string): string",
-                    "start": 100,
-                    "end": 150,
-                    "leadingComments": [
-                        {
-                            "kind": "multi-line",
-                            "text": "/**\n * Greeting function.\n * @param {string} name\n */",
-                            "pos": 0,
-                            "end": 99,
-                            "isJSDoc": True,
-                        },
-                    ],
-                },
-            ],
-        }
-
-        symbols = ts_analyzer._extract_symbols(mock_ast_data)
+        symbols = ts_analyzer._extract_symbols(_MOCK_AST_SYMBOL_WITH_JSDOC)
 
         assert len(symbols) == 1
         assert symbols[0]["name"] == "greet"
@@ -407,19 +543,7 @@ class TestSymbolJSDocLinkage:
     @pytest.mark.analyzer
     def test_symbol_without_jsdoc(self, ts_analyzer: TypeScriptAnalyzer):
         """Test that symbols without JSDoc have None for jsdoc field."""
-        mock_ast_data = {
-            "nodes": [
-                {
-                    "kind": "FunctionDeclaration",
-                    "text": "function test(): void",
-                    "start": 100,
-                    "end": 150,
-                    "leadingComments": [],
-                },
-            ],
-        }
-
-        symbols = ts_analyzer._extract_symbols(mock_ast_data)
+        symbols = ts_analyzer._extract_symbols(_MOCK_AST_SYMBOL_WITHOUT_JSDOC)
 
         assert len(symbols) == 1
         assert symbols[0]["jsdoc"] is None
@@ -428,42 +552,7 @@ class TestSymbolJSDocLinkage:
     @pytest.mark.analyzer
     def test_multiple_symbols_jsdoc_linkage(self, ts_analyzer: TypeScriptAnalyzer):
         """Test that multiple symbols correctly link to their respective JSDoc."""
-        mock_ast_data = {
-            "nodes": [
-                {
-                    "kind": "FunctionDeclaration",
-                    "text": "function func1(): void",
-                    "start": 100,
-                    "end": 150,
-                    "leadingComments": [
-                        {
-                            "kind": "multi-line",
-                            "text": "/**\n * Function 1\n */",
-                            "pos": 0,
-                            "end": 99,
-                            "isJSDoc": True,
-                        },
-                    ],
-                },
-                {
-                    "kind": "FunctionDeclaration",
-                    "text": "function func2(): void",
-                    "start": 200,
-                    "end": 250,
-                    "leadingComments": [
-                        {
-                            "kind": "multi-line",
-                            "text": "/**\n * Function 2\n */",
-                            "pos": 151,
-                            "end": 199,
-                            "isJSDoc": True,
-                        },
-                    ],
-                },
-            ],
-        }
-
-        symbols = ts_analyzer._extract_symbols(mock_ast_data)
+        symbols = ts_analyzer._extract_symbols(_MOCK_AST_MULTI_SYMBOL)
 
         assert len(symbols) == 2
         assert symbols[0]["name"] == "func1"
@@ -475,58 +564,76 @@ class TestSymbolJSDocLinkage:
     @pytest.mark.analyzer
     def test_class_method_jsdoc_linkage(self, ts_analyzer: TypeScriptAnalyzer):
         """Test that class methods correctly link to their JSDoc."""
+        symbols = ts_analyzer._extract_symbols(_MOCK_AST_CLASS_METHOD)
+        by_kind = ts_analyzer._index_symbols_by_kind(symbols)
+
+        assert len(symbols) == 2
+        assert by_kind == {"ClassDeclaration": [0], "MethodDeclaration": [1]}
+        # Class should have JSDoc
+        class_symbol = symbols[by_kind["ClassDeclaration"][0]]
+        assert class_symbol["jsdoc"] is not None
+        # Method should have JSDoc
+        method_symbol = symbols[by_kind["MethodDeclaration"][0]]
+        assert method_symbol["jsdoc"] is not None
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_shared_jsdoc_is_parsed_once(self, temp_dir: Path):
+        """Test that a comment seen by several nodes and both extractors is parsed once."""
+        comment = {
+            "kind": "multi-line",
+            "text": "/**\n * Exported.\n * @returns {void} Nothing\n */",
+            "pos": 0,
+            "end": 40,
+            "isJSDoc": True,
+        }
         mock_ast_data = {
             "nodes": [
                 {
-                    "kind": "ClassDeclaration",
-                    "text": "class Calculator",
-                    "start": 100,
-                    "end": 200,
-                    "leadingComments": [
-                        {
-                            "kind": "multi-line",
-                            "text": "/**\n * Calculator class\n */",
-                            "pos": 0,
-                            "end": 99,
-                            "isJSDoc": True,
-                        },
-                    ],
+                    "kind": "FunctionDeclaration",
+                    "text": "export function f(): void {}",
+                    "start": 41,
+                    "end": 69,
+                    "leadingComments": [comment],
                 },
                 {
-                    "kind": "MethodDeclaration",
-                    "text": "add(a: number, b: number): number",
-                    "start": 201,
-                    "end": 250,
-                    "leadingComments": [
-                        {
-                            "kind": "multi-line",
-                            "text": "/**\n * Add method\n */",
-                            "pos": 151,
-                            "end": 200,
-                            "isJSDoc": True,
-                        },
-                    ],
+                    "kind": "ExportKeyword",
+                    "text": "export",
+                    "start": 41,
+                    "end": 47,
+                    "leadingComments": [comment],
                 },
             ],
         }
-
-        symbols = ts_analyzer._extract_symbols(mock_ast_data)
-
-        assert len(symbols) == 2
-        # Class should have JSDoc
-        class_symbol = next(
-            (s for s in symbols if s["kind"] == "ClassDeclaration"),
-            None,
-        )
-        assert class_symbol is not None
-        assert class_symbol["jsdoc"] is not None
-        # Method should have JSDoc
-        method_symbol = next(
-            (s for s in symbols if s["kind"] == "MethodDeclaration"),
-            None,
+        source_file = temp_dir / "shared.ts"
+        source_file.write_text("export function f(): void {}", encoding="utf-8")
+        analyzer = TypeScriptAnalyzer()
+
+        with (
+            patch.object(analyzer, "_parse_ast", return_value=mock_ast_data),
+            patch.object(
+                analyzer,
+                "_normalize_comment_text",
+                wraps=analyzer._normalize_comment_text,
+            ) as normalize,
+        ):
+            result = analyzer.analyze_file(source_file)
+
+        assert normalize.call_count == 1
+        assert len(result["jsdoc_comments"]) == 2
+        assert result["symbols_by_kind"] == {"FunctionDeclaration": [0]}
+        assert result["symbols"][0]["jsdoc"]["tags"]["returns"]["type"] == "void"
+
+        # Entries share no tag data: editing one leaves the others as parsed
+        tags = [result["symbols"][0]["jsdoc"]["tags"]] + [
+            entry["tags"] for entry in result["jsdoc_comments"]
+        ]
+        tags[0]["returns"]["type"] = "never"
+        tags[1]["params"].append({"name": "x"})
+        assert tags[1]["returns"]["type"] == "void"
+        assert tags[2] == analyzer._parse_jsdoc_tags(
+            analyzer._normalize_comment_text(comment["text"])
         )
-        assert method_symbol is not None
-        assert method_symbol["jsdoc"] is not None
 
 
 class TestJSDocEdgeCases:
@@ -640,6 +747,49 @@ class TestFullAnalysisIntegration:
             assert "normalized_text" in jsdoc
             assert "tags" in jsdoc
 
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("sample", ["sample_ts_source", "sample_ts_source_complex"])
+    def test_analyze_source_includes_jsdoc_in_symbols(
+        self,
+        ts_analyzer: TypeScriptAnalyzer,
+        sample: str,
+        request: pytest.FixtureRequest,
+    ):
+        """Test that analyze_source returns symbols with integrated JSDoc."""
+        ts_code, virtual_path = request.getfixturevalue(sample)
+
+        # This test requires Node.js and TypeScript compiler
+        # Skip if not available
+        try:
+            result = ts_analyzer.analyze_source(ts_code, virtual_path)
+        except (FileNotFoundError, RuntimeError) as e:
+            pytest.skip(f"TypeScript compiler not available: {e}")
+
+        assert result["file_path"] == virtual_path
+        assert any(s.get("jsdoc") is not None for s in result["symbols"])
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_analyze_source_does_not_read_files(
+        self, sample_ts_source: tuple[str, str]
+    ):
+        """Test that analyze_source parses the given text under its virtual path."""
+        ts_code, virtual_path = sample_ts_source
+        analyzer = TypeScriptAnalyzer()
+
+        with (
+            patch.object(
+                analyzer, "_parse_ast", return_value={"nodes": []}
+            ) as parse_ast,
+            patch.object(Path, "read_text") as read_text,
+        ):
+            result = analyzer.analyze_source(ts_code, virtual_path)
+
+        parse_ast.assert_called_once_with(Path(virtual_path), ts_code)
+        read_text.assert_not_called()
+        assert result["file_path"] == virtual_path
+
     @pytest.mark.unit
     @pytest.mark.analyzer
     def test_analyze_file_error_handling(
@@ -652,3 +802,138 @@ class TestFullAnalysisIntegration:
 
         with pytest.raises((FileNotFoundError, RuntimeError)):
             ts_analyzer.analyze_file(invalid_file)
+
+
+class TestFunctionBodies:
+    """Test suite for the signatures-only parse mode."""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("analyze_bodies", [True, False])
+    def test_body_mode_is_passed_to_node(self, analyze_bodies: bool):
+        """Test that the Node bridge is told whether to descend into bodies."""
+        analyzer = TypeScriptAnalyzer(analyze_bodies=analyze_bodies)
+        response = {"ok": True, "ast": {"nodes": []}}
+
+        with patch.object(
+            analyzer, "_bridge_request", return_value=response
+        ) as bridge_request:
+            analyzer._parse_ast(Path("test.ts"), "function f() { const x = 1; }")
+
+        request = bridge_request.call_args.args[1]
+        assert request["analyzeBodies"] is analyze_bodies
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_body_mode_is_part_of_cache_key(self, temp_dir: Path):
+        """Test that ASTs parsed with and without bodies are cached separately."""
+        source_file = temp_dir / "cached.ts"
+        source_file.write_text("function f() { const x = 1; }", encoding="utf-8")
+        cache_dir = temp_dir / "ast-cache"
+
+        with patch.object(
+            TypeScriptAnalyzer, "_parse_ast", return_value={"nodes": []}
+        ) as parse_ast:
+            for analyze_bodies in (True, False, True, False):
+                TypeScriptAnalyzer(
+                    ast_cache_dir=cache_dir, analyze_bodies=analyze_bodies
+                ).analyze_file(source_file)
+
+        assert parse_ast.call_count == 2
+
+
+class TestNodeBridge:
+    """Test suite for the long-lived Node.js parser process."""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_error_response_raises(self):
+        """Test that a parse error reported by the bridge raises RuntimeError."""
+        analyzer = TypeScriptAnalyzer()
+        response = {"ok": False, "error": "SyntaxError: boom"}
+
+        with (
+            patch.object(analyzer, "_bridge_request", return_value=response),
+            pytest.raises(RuntimeError, match="SyntaxError: boom"),
+        ):
+            analyzer._parse_ast(Path("test.ts"), "const")
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_analyze_files_returns_results_in_order(self, temp_dir: Path):
+        """Test that analyze_files returns one result per file, in order."""
+        files = []
+        for name in ("a.ts", "b.ts"):
+            source_file = temp_dir / name
+            source_file.write_text("const x = 1;", encoding="utf-8")
+            files.append(source_file)
+
+        with (
+            TypeScriptAnalyzer() as analyzer,
+            patch.object(
+                analyzer, "_parse_ast", return_value={"nodes": []}
+            ) as parse_ast,
+        ):
+            results = analyzer.analyze_files(files)
+
+        assert [r["file_path"] for r in results] == [str(f) for f in files]
+        assert parse_ast.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_close_without_bridge_is_noop(self):
+        """Test that close() can be called before any parse, and repeatedly."""
+        analyzer = TypeScriptAnalyzer()
+        analyzer.close()
+        analyzer.close()
+        assert analyzer._bridge is None
+
+
+class TestASTCache:
+    """Test suite for the content-keyed on-disk AST cache."""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_unchanged_file_is_parsed_once(self, temp_dir: Path):
+        """Test that cached ASTs are reused across analyzers until the file changes."""
+        source_file = temp_dir / "cached.ts"
+        source_file.write_text("function greet(): void {}", encoding="utf-8")
+        cache_dir = temp_dir / "ast-cache"
+        mock_ast_data: dict[str, Any] = {
+            "nodes": [{"kind": "FunctionDeclaration", "text": "function greet()"}]
+        }
+
+        with patch.object(
+            TypeScriptAnalyzer, "_parse_ast", return_value=mock_ast_data
+        ) as parse_ast:
+            first = TypeScriptAnalyzer(ast_cache_dir=cache_dir).analyze_file(
+                source_file
+            )
+            second = TypeScriptAnalyzer(ast_cache_dir=cache_dir).analyze_file(
+                source_file
+            )
+            assert parse_ast.call_count == 1
+            assert first == second
+
+            source_file.write_text("function other(): void {}", encoding="utf-8")
+            TypeScriptAnalyzer(ast_cache_dir=cache_dir).analyze_file(source_file)
+            assert parse_ast.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_corrupt_cache_entry_is_reparsed(self, temp_dir: Path):
+        """Test that an unreadable cache entry falls back to parsing."""
+        source_file = temp_dir / "cached.ts"
+        source_file.write_text("const x = 1;", encoding="utf-8")
+        cache_dir = temp_dir / "ast-cache"
+        analyzer = TypeScriptAnalyzer(ast_cache_dir=cache_dir)
+
+        with patch.object(
+            TypeScriptAnalyzer, "_parse_ast", return_value={"nodes": []}
+        ) as parse_ast:
+            analyzer.analyze_file(source_file)
+            for entry in cache_dir.glob("*.json"):
+                entry.write_text("{not json", encoding="utf-8")
+            analyzer.analyze_file(source_file)
+
+        assert parse_ast.call_count == 2
@@ -1,7 +1,11 @@
 """Unit tests for TypeScript parser service."""
 
 import json
+import queue
+import shutil
 import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
@@ -12,26 +16,214 @@ from services.typescript_parser import (
     TypeScriptParser,
 )
 
+pytestmark = pytest.mark.unit
+
+# Mocked parser output, serialized once at import time
+_MOCK_CLASS_AST = {
+    "type": "Program",
+    "body": [
+        {
+            "type": "ClassDeclaration",
+            "id": {"name": "MyClass"},
+            "loc": {"start": {"line": 1}},
+        },
+    ],
+}
+_MOCK_CLASS_AST_STDOUT = json.dumps({"success": True, "ast": _MOCK_CLASS_AST}).encode()
+
+_MOCK_FUNCTION_AST = {
+    "type": "Program",
+    "body": [
+        {
+            "type": "FunctionDeclaration",
+            "id": {"name": "myFunction"},
+            "loc": {"start": {"line": 1}},
+        },
+    ],
+}
+_MOCK_FUNCTION_AST_STDOUT = json.dumps(
+    {"success": True, "ast": _MOCK_FUNCTION_AST}
+).encode()
+
+_MOCK_SYNTAX_ERROR_STDOUT = json.dumps(
+    {"success": False, "error": {"message": "Syntax error"}},
+).encode()
+_MOCK_SUBPROCESS_ERROR_STDERR = json.dumps({"message": "Subprocess failed"})
+
+# Stand-in worker scripts for the tests that run a real Node.js process
+_ECHO_WORKER_JS = """
+require('readline').createInterface({ input: process.stdin }).on('line', (line) => {
+  const request = JSON.parse(line);
+  const reply = JSON.stringify(request).includes('invalid')
+    ? { success: false, error: { message: 'Syntax error' } }
+    : { success: true, ast: { pid: process.pid, request } };
+  process.stdout.write(JSON.stringify(reply) + '\\n');
+});
+"""
+_FAILING_WORKER_JS = (
+    f"process.stderr.write({json.dumps(_MOCK_SUBPROCESS_ERROR_STDERR)});"
+    " process.exit(1);"
+)
+_SILENT_WORKER_JS = "process.stdin.resume();"
 
-class TestTypeScriptParser:
-    """Test suite for TypeScriptParser."""
+requires_node = pytest.mark.skipif(
+    shutil.which("node") is None, reason="Node.js is not installed"
+)
+
+
+def _estree_installed():
+    """Whether the real parser script can load typescript-estree."""
+    if shutil.which("node") is None:
+        return False
+    return (
+        subprocess.run(
+            ["node", "-e", "require.resolve('@typescript-eslint/typescript-estree')"],
+            cwd=Path(__file__).parents[2],
+            capture_output=True,
+            check=False,
+        ).returncode
+        == 0
+    )
+
+
+requires_estree = pytest.mark.skipif(
+    not _estree_installed(),
+    reason="Node.js or @typescript-eslint/typescript-estree is not installed",
+)
+
+
+def _enum_export(name):
+    """Build an `export enum <name>` node."""
+    return {
+        "type": "ExportNamedDeclaration",
+        "declaration": {"type": "TSEnumDeclaration", "id": {"name": name}},
+    }
+
+
+def _namespace(name, body):
+    """Build a `namespace <name> { ... }` node."""
+    return {
+        "type": "TSModuleDeclaration",
+        "id": {"name": name},
+        "body": {"type": "TSModuleBlock", "body": body},
+    }
+
+
+# Export ASTs shared by the extract_exported_symbols tests (only read)
+_EXPORT_DECLARATIONS_AST = {
+    "body": [
+        {
+            "type": "ExportNamedDeclaration",
+            "declaration": {
+                "type": "ClassDeclaration",
+                "id": {"name": "MyClass"},
+                "loc": {"start": {"line": 3}},
+            },
+            "specifiers": [],
+        },
+        {
+            "type": "ExportDefaultDeclaration",
+            "declaration": {"type": "FunctionDeclaration", "id": None},
+        },
+    ],
+}
+
+_EXPORT_SPECIFIERS_AST = {
+    "body": [
+        {
+            "type": "ExportNamedDeclaration",
+            "specifiers": [
+                {
+                    "local": {"name": "Options"},
+                    "exported": {"name": "Options"},
+                    "exportKind": "type",
+                },
+            ],
+            "source": {"value": "./options"},
+        },
+        {"type": "ExportAllDeclaration", "source": {"value": "./utils"}},
+    ],
+}
+
+_NESTED_NAMESPACE_EXPORT_AST = {
+    "body": [
+        {
+            "type": "TSModuleDeclaration",
+            "id": {"name": "Outer"},
+            "body": {
+                "type": "TSModuleBlock",
+                "body": [
+                    {
+                        "type": "TSModuleDeclaration",
+                        "id": {"name": "Inner"},
+                        "body": {
+                            "type": "TSModuleBlock",
+                            "body": [
+                                {
+                                    "type": "ExportNamedDeclaration",
+                                    "declaration": {
+                                        "type": "TSEnumDeclaration",
+                                        "id": {"name": "Color"},
+                                    },
+                                },
+                            ],
+                        },
+                    },
+                ],
+            },
+        },
+    ],
+}
+
+_MIXED_NAMESPACE_EXPORT_AST = {
+    "body": [
+        _enum_export("Before"),
+        _namespace("Outer", [_enum_export("Inside")]),
+        _enum_export("After"),
+    ],
+}
+
+# Namespaces nested deeper than the default recursion limit
+_DEEP_NAMESPACE_DEPTH = sys.getrecursionlimit() + 100
+_DEEP_NAMESPACE_EXPORT_AST = {"body": [_enum_export("Deep")]}
+for _ in range(_DEEP_NAMESPACE_DEPTH):
+    _DEEP_NAMESPACE_EXPORT_AST = {
+        "body": [_namespace("N", _DEEP_NAMESPACE_EXPORT_AST["body"])],
+    }
+
+
+@pytest.fixture
+def make_worker_parser(mock_nodejs, tmp_path):
+    """Build parsers whose Node.js worker runs the given script."""
+    parsers = []
+
+    def make(script):
+        script_path = tmp_path / f"worker-{len(parsers)}.js"
+        script_path.write_text(script)
+        parsers.append(TypeScriptParser(str(script_path)))
+        return parsers[-1]
+
+    yield make
+    for parser in parsers:
+        parser.close()
 
-    @pytest.mark.unit
-    def test_init_with_default_script(self, mock_nodejs):
-        """Test parser initialization with default script path."""
-        parser = TypeScriptParser()
-        assert parser.parser_script.exists()
 
-    @pytest.mark.unit
-    def test_init_with_custom_script(self, mock_nodejs, tmp_path):
-        """Test parser initialization with custom script path."""
-        custom_script = tmp_path / "custom-parser.js"
-        custom_script.write_text("console.log('test');")
+class TestTypeScriptParser:
+    """Test suite for TypeScriptParser."""
 
-        parser = TypeScriptParser(str(custom_script))
-        assert parser.parser_script == custom_script
+    @pytest.mark.parametrize("custom", [False, True], ids=["default", "custom"])
+    def test_init_with_script(self, mock_nodejs, tmp_path, custom):
+        """Test parser initialization with the default and a custom script path."""
+        if custom:
+            custom_script = tmp_path / "custom-parser.js"
+            custom_script.write_text("console.log('test');")
+            parser = TypeScriptParser(str(custom_script))
+            assert parser.parser_script == custom_script
+        else:
+            parser = TypeScriptParser()
+            assert parser.parser_script.exists()
+        mock_nodejs.assert_called_once()
 
-    @pytest.mark.unit
     def test_init_with_nonexistent_script(self, mock_nodejs, tmp_path):
         """Test parser initialization with non-existent script."""
         nonexistent = tmp_path / "does-not-exist.js"
@@ -39,14 +231,6 @@ class TestTypeScriptParser:
         with pytest.raises(FileNotFoundError):
             TypeScriptParser(str(nonexistent))
 
-    @pytest.mark.unit
-    def test_check_nodejs_success(self, mock_nodejs):
-        """Test Node.js availability check succeeds."""
-        parser = TypeScriptParser()
-        # Initialization calls _check_nodejs, no need to call separately
-        assert parser is not None
-
-    @pytest.mark.unit
     def test_check_nodejs_not_found(self, mock_nodejs):
         """Test Node.js availability check fails when Node.js not installed."""
         mock_nodejs.side_effect = FileNotFoundError("node: command not found")
@@ -54,220 +238,451 @@ class TestTypeScriptParser:
         with pytest.raises(NodeJSNotFoundError):
             TypeScriptParser()
 
-    @pytest.mark.unit
-    def test_parse_file_success(self, mock_nodejs, tmp_path):
-        """Test successful file parsing."""
-        mock_ast = {
-            "type": "Program",
-            "body": [
-                {
-                    "type": "ClassDeclaration",
-                    "id": {"name": "MyClass"},
-                    "loc": {"start": {"line": 1}},
-                },
-            ],
-        }
+    def test_check_nodejs_runs_once(self, mock_nodejs):
+        """Test that only the first successful construction checks Node.js."""
+        mock_nodejs.side_effect = FileNotFoundError("node: command not found")
+        with pytest.raises(NodeJSNotFoundError):
+            TypeScriptParser()
 
-        # Create a temporary test file
-        test_file = tmp_path / "test.ts"
-        test_file.write_text("export class MyClass {}")
+        # A failed check is not remembered
+        mock_nodejs.side_effect = None
+        TypeScriptParser()
+        TypeScriptParser()
 
-        mock_nodejs.return_value = Mock(
-            returncode=0,
-            stdout=json.dumps({"success": True, "ast": mock_ast}),
-            stderr="",
-        )
+        assert mock_nodejs.call_count == 2
 
-        parser = TypeScriptParser()
-        result = parser.parse_file(str(test_file))
+    def test_parse_file_success(self, ts_parser, mock_parser_worker, sample_ts_files):
+        """Test successful file parsing."""
+        test_file = sample_ts_files / "class.ts"
 
-        assert result == mock_ast
-        mock_nodejs.assert_called()
+        mock_parser_worker.return_value = _MOCK_CLASS_AST_STDOUT
 
-    @pytest.mark.unit
-    def test_parse_file_parse_error(self, mock_nodejs, tmp_path):
-        """Test file parsing with syntax error."""
-        # Create a temporary test file
-        test_file = tmp_path / "test.ts"
-        test_file.write_text("invalid syntax here")
+        result = ts_parser.parse_file(str(test_file))
 
-        mock_nodejs.return_value = Mock(
-            returncode=0,
-            stdout=json.dumps(
-                {
-                    "success": False,
-                    "error": {"message": "Syntax error"},
-                },
-            ),
-            stderr="",
-        )
+        assert result == _MOCK_CLASS_AST
+        mock_parser_worker.assert_called_once_with({"filePath": str(test_file)})
 
-        parser = TypeScriptParser()
+    def test_parse_file_parse_error(
+        self, ts_parser, mock_parser_worker, sample_ts_files
+    ):
+        """Test file parsing with syntax error."""
+        test_file = sample_ts_files / "invalid.ts"
+
+        mock_parser_worker.return_value = _MOCK_SYNTAX_ERROR_STDOUT
 
         with pytest.raises(ParseError) as exc_info:
-            parser.parse_file(str(test_file))
+            ts_parser.parse_file(str(test_file))
 
         assert "Syntax error" in str(exc_info.value)
 
-    @pytest.mark.unit
-    def test_parse_file_subprocess_error(self, mock_nodejs, tmp_path):
-        """Test file parsing with subprocess error."""
-        # Create a temporary test file
+    def test_parse_file_cache_hit(self, mock_nodejs, mock_parser_worker, tmp_path):
+        """Test that an unchanged file is served from the AST cache."""
         test_file = tmp_path / "test.ts"
-        test_file.write_text("export class Test {}")
-
-        # First call for Node.js check succeeds, second call for parsing fails
-        mock_nodejs.side_effect = [
-            Mock(returncode=0, stdout="v18.0.0\n"),  # Node.js check
-            Mock(
-                returncode=1,
-                stdout="",
-                stderr=json.dumps({"error": "Subprocess failed"}),
-            ),  # Parse fails
-        ]
+        test_file.write_text("export class MyClass {}")
+        mock_parser_worker.return_value = _MOCK_CLASS_AST_STDOUT
+        parser = TypeScriptParser(ast_cache_dir=tmp_path / "cache")
 
-        parser = TypeScriptParser()
+        assert parser.parse_file(test_file) == _MOCK_CLASS_AST
+        # A new parser shares the on-disk cache
+        cached = TypeScriptParser(ast_cache_dir=tmp_path / "cache")
+        assert cached.parse_file(test_file) == _MOCK_CLASS_AST
+        assert mock_parser_worker.call_count == 1
 
-        with pytest.raises(ParseError):
-            parser.parse_file(str(test_file))
+        # An edited file misses the cache
+        test_file.write_text("export class MyClass { x = 1; }")
+        parser.parse_file(test_file)
+        assert mock_parser_worker.call_count == 2
 
-    @pytest.mark.unit
-    def test_parse_file_nonexistent(self, mock_nodejs):
+    def test_parse_file_nonexistent(self, ts_parser):
         """Test parsing non-existent file."""
-        parser = TypeScriptParser()
-
         with pytest.raises(FileNotFoundError):
-            parser.parse_file("nonexistent.ts")
+            ts_parser.parse_file("nonexistent.ts")
 
-    @pytest.mark.unit
-    def test_parse_string_success(self, mock_nodejs):
+    def test_parse_string_success(self, ts_parser, mock_parser_worker):
         """Test successful string parsing."""
-        mock_ast = {
-            "type": "Program",
-            "body": [
-                {
-                    "type": "FunctionDeclaration",
-                    "id": {"name": "myFunction"},
-                    "loc": {"start": {"line": 1}},
-                },
-            ],
-        }
-
-        mock_nodejs.return_value = Mock(
-            returncode=0,
-            stdout=json.dumps({"success": True, "ast": mock_ast}),
-            stderr="",
-        )
+        mock_parser_worker.return_value = _MOCK_FUNCTION_AST_STDOUT
 
-        parser = TypeScriptParser()
         source_code = "function myFunction() {}"
-        result = parser.parse_string(source_code)
+        result = ts_parser.parse_string(source_code)
 
-        assert result == mock_ast
+        assert result == _MOCK_FUNCTION_AST
+        mock_parser_worker.assert_called_once_with({"sourceCode": source_code})
 
-    @pytest.mark.unit
-    def test_parse_string_empty(self, mock_nodejs):
-        """Test parsing empty string."""
-        parser = TypeScriptParser()
+    def test_parse_without_orjson(
+        self, mock_nodejs, mock_parser_worker, monkeypatch, tmp_path
+    ):
+        """Test that parsing and the AST cache work with the json module alone."""
+        monkeypatch.setattr("services.typescript_parser.orjson", None)
+        test_file = tmp_path / "test.ts"
+        test_file.write_text("export class MyClass {}")
+        mock_parser_worker.return_value = _MOCK_CLASS_AST_STDOUT
+        parser = TypeScriptParser(ast_cache_dir=tmp_path / "cache")
+
+        assert parser.parse_file(test_file) == _MOCK_CLASS_AST
+        assert parser.parse_file(test_file) == _MOCK_CLASS_AST
+        assert mock_parser_worker.call_count == 1
+
+    @pytest.mark.parametrize("reply", [b"not json\n", b'"\xff"\n'])
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+    def test_parse_string_invalid_json(
+        self, ts_parser, mock_parser_worker, monkeypatch, reply, use_orjson
+    ):
+        """Test string parsing when the worker replies with invalid JSON."""
+        if not use_orjson:
+            monkeypatch.setattr("services.typescript_parser.orjson", None)
+        mock_parser_worker.return_value = reply
 
+        with pytest.raises(ParseError) as exc_info:
+            ts_parser.parse_string("const x = 1;")
+
+        assert "JSON" in str(exc_info.value)
+
+    def test_parse_string_empty(self, ts_parser):
+        """Test parsing empty string."""
         with pytest.raises(ValueError) as exc_info:
-            parser.parse_string("")
+            ts_parser.parse_string("")
 
         assert "empty" in str(exc_info.value).lower()
 
-    @pytest.mark.unit
-    def test_parse_string_timeout(self, mock_nodejs):
-        """Test string parsing timeout."""
-        # First call for Node.js check succeeds, second call for parsing times out
-        mock_nodejs.side_effect = [
-            Mock(returncode=0, stdout="v18.0.0\n"),  # Node.js check
-            subprocess.TimeoutExpired("node", 30),  # Parse times out
+    @requires_estree
+    @pytest.mark.parametrize("source", ["", "  \n\t\n"], ids=["empty", "whitespace"])
+    def test_parse_file_empty_source_with_worker(self, mock_nodejs, tmp_path, source):
+        """Test that the worker rejects empty files, like parse_string does."""
+        empty_file = tmp_path / "empty.ts"
+        empty_file.write_text(source)
+
+        with TypeScriptParser() as parser:
+            with pytest.raises(ParseError) as exc_info:
+                parser.parse_file(empty_file)
+
+            assert "Source code is empty" in str(exc_info.value)
+
+    @requires_node
+    def test_worker_is_reused(self, make_worker_parser, sample_ts_files):
+        """Test that one Node.js worker serves every parse of a parser."""
+        parser = make_worker_parser(_ECHO_WORKER_JS)
+        test_file = sample_ts_files / "class.ts"
+
+        first = parser.parse_file(test_file)
+        second = parser.parse_string("const x = 1;")
+
+        assert first["request"] == {"filePath": str(test_file)}
+        assert second["request"] == {"sourceCode": "const x = 1;"}
+        assert first["pid"] == second["pid"]
+
+    @requires_node
+    def test_parse_files_returns_asts_in_order(
+        self, make_worker_parser, sample_ts_files, tmp_path
+    ):
+        """Test that a batch of files is parsed by one worker, in order."""
+        parser = make_worker_parser(_ECHO_WORKER_JS)
+        other_file = tmp_path / "other.ts"
+        other_file.write_text("export const x = 1;")
+        file_paths = [sample_ts_files / "class.ts", str(other_file)]
+
+        asts = parser.parse_files(file_paths)
+
+        assert [ast["request"] for ast in asts] == [
+            {"filePath": str(path)} for path in file_paths
         ]
+        assert asts[0]["pid"] == asts[1]["pid"]
 
-        parser = TypeScriptParser()
+    @requires_node
+    def test_parse_files_error_keeps_worker_in_sync(
+        self, make_worker_parser, sample_ts_files
+    ):
+        """Test that a failed file names its path and later parses still match."""
+        parser = make_worker_parser(_ECHO_WORKER_JS)
+        invalid_file = sample_ts_files / "invalid.ts"
 
         with pytest.raises(ParseError) as exc_info:
-            parser.parse_string("const x = 1;")
+            parser.parse_files([invalid_file, sample_ts_files / "class.ts"])
 
-        assert "timed out" in str(exc_info.value).lower()
+        assert str(invalid_file) in str(exc_info.value)
+        assert "Syntax error" in str(exc_info.value)
+        ast = parser.parse_string("const x = 1;")
+        assert ast["request"] == {"sourceCode": "const x = 1;"}
+
+    @requires_node
+    def test_parse_files_sends_only_cache_misses(
+        self, make_worker_parser, sample_ts_files, tmp_path
+    ):
+        """Test that parse_files reuses cached ASTs and parses the rest."""
+        parser = make_worker_parser(_ECHO_WORKER_JS)
+        parser.ast_cache_dir = tmp_path / "cache"
+        other_file = tmp_path / "other.ts"
+        other_file.write_text("export const x = 1;")
+        class_file = sample_ts_files / "class.ts"
+
+        cached = parser.parse_file(class_file)
+        asts = parser.parse_files([class_file, other_file])
+
+        assert asts[0] == cached
+        assert asts[1]["request"] == {"filePath": str(other_file)}
+
+        # Everything is cached now, so no worker is needed
+        parser.close()
+        assert parser.parse_files([class_file, other_file]) == asts
+        assert parser._worker is None
+
+    @requires_node
+    def test_parse_stream_yields_asts_in_order(self, make_worker_parser, tmp_path):
+        """Test that parse_stream yields one AST per path, in order."""
+        parser = make_worker_parser(_ECHO_WORKER_JS)
+        file_paths = []
+        for i in range(40):
+            file_paths.append(tmp_path / f"file{i}.ts")
+            file_paths[-1].write_text(f"export const x{i} = {i};")
+
+        asts = list(parser.parse_stream(iter(file_paths)))
+
+        assert [ast["request"] for ast in asts] == [
+            {"filePath": str(path)} for path in file_paths
+        ]
+        assert len({ast["pid"] for ast in asts}) == 1
+
+    @requires_node
+    def test_parse_stream_stopped_early(self, make_worker_parser, tmp_path):
+        """Test that abandoning a stream leaves no stale replies behind."""
+        parser = make_worker_parser(_ECHO_WORKER_JS)
+        file_paths = []
+        for i in range(5):
+            file_paths.append(tmp_path / f"file{i}.ts")
+            file_paths[-1].write_text(f"export const x{i} = {i};")
+
+        stream = parser.parse_stream(file_paths)
+        assert next(stream)["request"] == {"filePath": str(file_paths[0])}
+        stream.close()
+
+        ast = parser.parse_string("const x = 1;")
+        assert ast["request"] == {"sourceCode": "const x = 1;"}
+
+    @requires_node
+    def test_parse_stream_leaves_parser_usable(self, make_worker_parser, tmp_path):
+        """Test that the parser can be used while one of its streams is open."""
+        parser = make_worker_parser(_ECHO_WORKER_JS)
+        file_paths = []
+        for i in range(3):
+            file_paths.append(tmp_path / f"file{i}.ts")
+            file_paths[-1].write_text(f"export const x{i} = {i};")
+
+        requests = []
+        for ast in parser.parse_stream(file_paths):
+            requests.append(ast["request"])
+            requests.append(parser.parse_string("let x = 1")["request"])
+
+        assert requests == [
+            request
+            for path in file_paths
+            for request in ({"filePath": str(path)}, {"sourceCode": "let x = 1"})
+        ]
 
-    @pytest.mark.unit
-    def test_extract_public_symbols_classes(self, mock_nodejs):
-        """Test extracting class symbols from AST."""
-        ast = {
-            "body": [
-                {
-                    "type": "ClassDeclaration",
-                    "id": {"name": "MyClass"},
-                    "loc": {"start": {"line": 1}},
-                    "decorators": [{"type": "_kind"}],
-                },
-            ],
+        # A stream left suspended does not hold the parser either
+        stream = parser.parse_stream(file_paths)
+        next(stream)
+        assert parser.parse_string("let x = 1")["request"] == {
+            "sourceCode": "let x = 1"
         }
+        stream.close()
 
+    def test_parse_files_writes_batch_at_once(self, mock_nodejs, sample_ts_files):
+        """Test that a batch's requests reach the worker in a single write."""
+        file_paths = [sample_ts_files / "class.ts"] * 10
         parser = TypeScriptParser()
-        symbols = parser.extract_public_symbols(ast)
+        worker_output = queue.Queue()
+        for _ in file_paths:
+            worker_output.put(_MOCK_CLASS_AST_STDOUT)
+        parser._worker = Mock()
+        parser._worker_output = worker_output
 
-        assert len(symbols["classes"]) == 1
-        assert symbols["classes"][0]["name"] == "MyClass"
-        assert symbols["classes"][0]["decorators"] == 1
+        asts = parser.parse_files(file_paths)
 
-    @pytest.mark.unit
-    def test_extract_public_symbols_functions(self, mock_nodejs):
-        """Test extracting function symbols from AST."""
-        ast = {
-            "body": [
-                {
-                    "type": "FunctionDeclaration",
-                    "id": {"name": "myFunction"},
-                    "loc": {"start": {"line": 10}},
-                    "async": True,
-                },
-            ],
-        }
+        assert asts == [_MOCK_CLASS_AST] * 10
+        parser._worker.stdin.write.assert_called_once()
+        (payload,) = parser._worker.stdin.write.call_args.args
+        assert payload.count(b"\n") == 10
 
-        parser = TypeScriptParser()
-        symbols = parser.extract_public_symbols(ast)
+    def test_parse_files_nonexistent(self, ts_parser, sample_ts_files):
+        """Test that a missing file is reported before anything is parsed."""
+        with pytest.raises(FileNotFoundError):
+            ts_parser.parse_files([sample_ts_files / "class.ts", "nonexistent.ts"])
 
-        assert len(symbols["functions"]) == 1
-        assert symbols["functions"][0]["name"] == "myFunction"
-        assert symbols["functions"][0]["async"] is True
+        assert ts_parser._worker is None
 
-    @pytest.mark.unit
-    def test_extract_public_symbols_interfaces(self, mock_nodejs):
-        """Test extracting interface symbols from AST."""
-        ast = {
-            "body": [
-                {
-                    "type": "TSInterfaceDeclaration",
-                    "id": {"name": "MyInterface"},
-                    "loc": {"start": {"line": 5}},
-                },
-            ],
-        }
+    @requires_node
+    def test_worker_restarts_after_close(self, make_worker_parser):
+        """Test that a closed parser starts a new worker on the next parse."""
+        parser = make_worker_parser(_ECHO_WORKER_JS)
 
-        parser = TypeScriptParser()
-        symbols = parser.extract_public_symbols(ast)
+        first = parser.parse_string("const x = 1;")
+        parser.close()
+        second = parser.parse_string("const x = 1;")
 
-        assert len(symbols["interfaces"]) == 1
-        assert symbols["interfaces"][0]["name"] == "MyInterface"
+        assert first["pid"] != second["pid"]
 
-    @pytest.mark.unit
-    def test_extract_public_symbols_empty(self, mock_nodejs):
-        """Test extracting symbols from empty AST."""
-        ast = {"body": []}
+    @requires_node
+    def test_parse_file_subprocess_error(self, make_worker_parser, sample_ts_files):
+        """Test file parsing when the worker exits with an error."""
+        parser = make_worker_parser(_FAILING_WORKER_JS)
 
-        parser = TypeScriptParser()
-        symbols = parser.extract_public_symbols(ast)
+        with pytest.raises(ParseError) as exc_info:
+            parser.parse_file(sample_ts_files / "class.ts")
 
-        assert all(len(symbols[key]) == 0 for key in symbols)
+        assert "Subprocess failed" in str(exc_info.value)
 
-    @pytest.mark.unit
-    def test_extract_public_symbols_no_body(self, mock_nodejs):
-        """Test extracting symbols from AST without body."""
-        ast = {}
+    @requires_node
+    def test_parse_string_timeout(self, make_worker_parser, monkeypatch):
+        """Test string parsing timeout."""
+        monkeypatch.setattr("services.typescript_parser._PARSE_TIMEOUT", 0.2)
+        parser = make_worker_parser(_SILENT_WORKER_JS)
 
-        parser = TypeScriptParser()
-        symbols = parser.extract_public_symbols(ast)
+        with pytest.raises(ParseError) as exc_info:
+            parser.parse_string("const x = 1;")
+
+        assert "timed out" in str(exc_info.value).lower()
+        # The stuck worker is stopped
+        assert parser._worker is None
 
-        assert all(len(symbols[key]) == 0 for key in symbols)
+    @pytest.mark.parametrize(
+        ("ast", "bucket", "expected"),
+        [
+            pytest.param(
+                {
+                    "body": [
+                        {
+                            "type": "ClassDeclaration",
+                            "id": {"name": "MyClass"},
+                            "loc": {"start": {"line": 1}},
+                            "decorators": [{"type": "_kind"}],
+                        },
+                    ],
+                },
+                "classes",
+                {"name": "MyClass", "line": 1, "decorators": 1},
+                id="classes",
+            ),
+            pytest.param(
+                {
+                    "body": [
+                        {
+                            "type": "FunctionDeclaration",
+                            "id": {"name": "myFunction"},
+                            "loc": {"start": {"line": 10}},
+                            "async": True,
+                        },
+                    ],
+                },
+                "functions",
+                {"name": "myFunction", "line": 10, "async": True},
+                id="functions",
+            ),
+            pytest.param(
+                {
+                    "body": [
+                        {
+                            "type": "TSInterfaceDeclaration",
+                            "id": {"name": "MyInterface"},
+                            "loc": {"start": {"line": 5}},
+                        },
+                    ],
+                },
+                "interfaces",
+                {"name": "MyInterface", "line": 5},
+                id="interfaces",
+            ),
+            pytest.param({"body": []}, None, None, id="empty"),
+            pytest.param({}, None, None, id="no_body"),
+            pytest.param({"body": None}, None, None, id="body_not_list"),
+        ],
+    )
+    def test_extract_public_symbols(self, ts_parser, ast, bucket, expected):
+        """Test extracting public symbols of each kind, and from empty ASTs."""
+        symbols = ts_parser.extract_public_symbols(ast)
+
+        assert symbols.keys() == {
+            "classes",
+            "functions",
+            "interfaces",
+            "types",
+            "enums",
+        }
+        if bucket is not None:
+            assert symbols.pop(bucket) == [expected]
+        assert not any(symbols.values())
+
+    @pytest.mark.parametrize(
+        ("ast", "expected"),
+        [
+            pytest.param(
+                _EXPORT_DECLARATIONS_AST,
+                [
+                    {
+                        "symbol": "MyClass",
+                        "type": "class",
+                        "isDefault": False,
+                        "signature": {"line": 3},
+                    },
+                    {"symbol": "default", "type": "function", "isDefault": True},
+                ],
+                id="declarations",
+            ),
+            pytest.param(
+                _EXPORT_SPECIFIERS_AST,
+                [
+                    {
+                        "symbol": "Options",
+                        "type": "type",
+                        "isDefault": False,
+                        "signature": {"source": "./options"},
+                    },
+                    {
+                        "symbol": "*",
+                        "type": "all",
+                        "isDefault": False,
+                        "signature": {"source": "./utils"},
+                    },
+                ],
+                id="specifiers",
+            ),
+            pytest.param(
+                _NESTED_NAMESPACE_EXPORT_AST,
+                [
+                    {
+                        "symbol": "Color",
+                        "type": "enum",
+                        "isDefault": False,
+                        "signature": {"nestedIn": "Outer.Inner", "isNested": True},
+                    },
+                ],
+                id="nested_namespace",
+            ),
+            pytest.param(
+                _MIXED_NAMESPACE_EXPORT_AST,
+                [
+                    {"symbol": "Before", "type": "enum", "isDefault": False},
+                    {
+                        "symbol": "Inside",
+                        "type": "enum",
+                        "isDefault": False,
+                        "signature": {"nestedIn": "Outer", "isNested": True},
+                    },
+                    {"symbol": "After", "type": "enum", "isDefault": False},
+                ],
+                id="order_around_namespace",
+            ),
+            pytest.param({}, [], id="no_body"),
+            pytest.param({"body": None}, [], id="body_not_list"),
+        ],
+    )
+    def test_extract_exported_symbols(self, ts_parser, ast, expected):
+        """Test extracting exports of each kind, in source order."""
+        assert ts_parser.extract_exported_symbols(ast) == expected
+
+    def test_extract_exported_symbols_deep_namespace(self, ts_parser):
+        """Test that nesting deeper than the recursion limit is walked."""
+        exports = ts_parser.extract_exported_symbols(_DEEP_NAMESPACE_EXPORT_AST)
+
+        assert len(exports) == 1
+        assert exports[0]["signature"]["nestedIn"] == ".".join(
+            ["N"] * _DEEP_NAMESPACE_DEPTH,
+        )